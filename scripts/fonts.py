@@ -21,55 +21,38 @@ class FontManager:
     
     def __init__(self):
         self._fonts = {}
+        self._font_cache = {}  # (family, size, weight) -> tkfont.Font
+        self._family = self._pick_family()
         self._init_fonts()
     
-    def _init_fonts(self):
-        """Initialize all fonts with fallback handling"""
+    @staticmethod
+    def _pick_family():
+        """Pick the primary family if installed, otherwise the fallback"""
         try:
-            self._fonts['title'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=TITLE_FONT_SIZE, weight="bold"
-            )
-            self._fonts['button'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=BUTTON_FONT_SIZE, weight="bold"
-            )
-            self._fonts['item'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=ITEM_FONT_SIZE, weight="normal"
-            )
-            self._fonts['status'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=STATUS_FONT_SIZE, weight="normal"
-            )
-            self._fonts['small'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=SMALL_FONT_PT, weight="bold"
-            )
-            self._fonts['big'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=BIG_FONT_PT, weight="bold"
-            )
-            self._fonts['metadata'] = tkfont.Font(
-                family=FONT_FAMILY_PRIMARY, size=METADATA_FONT_PT, weight="normal"
-            )
+            if FONT_FAMILY_PRIMARY in tkfont.families():
+                return FONT_FAMILY_PRIMARY
         except Exception:
-            # Fallback to default fonts
-            self._fonts['title'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=TITLE_FONT_SIZE, weight="bold"
-            )
-            self._fonts['button'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=BUTTON_FONT_SIZE, weight="bold"
-            )
-            self._fonts['item'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=ITEM_FONT_SIZE, weight="normal"
-            )
-            self._fonts['status'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=STATUS_FONT_SIZE, weight="normal"
-            )
-            self._fonts['small'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=SMALL_FONT_PT, weight="bold"
-            )
-            self._fonts['big'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=BIG_FONT_PT, weight="bold"
-            )
-            self._fonts['metadata'] = tkfont.Font(
-                family=FONT_FAMILY_FALLBACK, size=METADATA_FONT_PT, weight="normal"
-            )
+            pass
+        return FONT_FAMILY_FALLBACK
+    
+    def _font(self, size, weight):
+        """Get a shared Font object (created once per family/size/weight)"""
+        key = (self._family, size, weight)
+        fnt = self._font_cache.get(key)
+        if fnt is None:
+            fnt = tkfont.Font(family=self._family, size=size, weight=weight)
+            self._font_cache[key] = fnt
+        return fnt
+    
+    def _init_fonts(self):
+        """Initialize all fonts (family chosen once in _pick_family)"""
+        self._fonts['title'] = self._font(TITLE_FONT_SIZE, "bold")
+        self._fonts['button'] = self._font(BUTTON_FONT_SIZE, "bold")
+        self._fonts['item'] = self._font(ITEM_FONT_SIZE, "normal")
+        self._fonts['status'] = self._font(STATUS_FONT_SIZE, "normal")
+        self._fonts['small'] = self._font(SMALL_FONT_PT, "bold")
+        self._fonts['big'] = self._font(BIG_FONT_PT, "bold")
+        self._fonts['metadata'] = self._font(METADATA_FONT_PT, "normal")
     
     def get(self, font_name):
         """Get a font by name"""
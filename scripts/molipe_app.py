@@ -8,6 +8,8 @@ Main orchestrator that manages screens and navigation
 import tkinter as tk
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -21,7 +23,14 @@ from screen_preset_browser import PresetBrowserScreen
 from screen_usb_browser import USBBrowserScreen
 from screen_midi_setup import MIDISetupScreen
 from fonts import FontManager
-from process_manager import ProcessManager
+from process_manager import ProcessManager, IS_LINUX
+
+# Shared scheduler: one Tk wakeup serves every periodic/delayed task
+TICK_INTERVAL_MS = 250
+CURSOR_ENFORCE_INTERVAL_MS = 250
+
+# Platform is fixed for the life of the process - decided once at import
+WINDOW_GEOMETRY = "1280x720+0+0" if IS_LINUX else "1280x720+100+100"
 
 
 class MolipeApp:
@@ -32,7 +41,7 @@ class MolipeApp:
         self.root.title("")
         
         # Paths - detect platform
-        if sys.platform.startswith("linux"):
+        if IS_LINUX:
             # On Linux/RPi: /home/patch/Desktop/molipe_01
             self.molipe_root = "/home/patch/Desktop/molipe_01"
         else:
@@ -40,10 +49,23 @@ class MolipeApp:
             scripts_dir = os.path.dirname(os.path.abspath(__file__))
             self.molipe_root = os.path.dirname(scripts_dir)
         
+        # Project folders (fixed for the session - joined once here)
+        self.my_projects_dir = os.path.join(self.molipe_root, "my_projects")
+        self.preset_projects_dir = os.path.join(self.molipe_root, "preset_projects")
+        
         # Initialize utilities
         self.fonts = FontManager()
         self.pd_manager = ProcessManager()
         
+        # Shared worker threads for short blocking jobs (connectivity probe,
+        # update precheck). Long jobs (git update, project copy/delete) keep
+        # their own daemon threads so they never queue behind each other or
+        # hold up exit
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='molipe-bg')
+        
+        # Named one-shot timers served by the shared tick: name -> (deadline, callback)
+        self._timers = {}
+        
         # Setup window
         self._setup_window()
         
@@ -60,14 +82,14 @@ class MolipeApp:
         
         # Enforce cursor hiding periodically (some systems re-enable it)
         self._enforce_cursor_hiding()
+        
+        # Start the shared scheduler tick
+        self.root.after(TICK_INTERVAL_MS, self._tick)
     
     def _setup_window(self):
         """Setup main window properties"""
         # Set geometry
-        if sys.platform.startswith("linux"):
-            self.root.geometry("1280x720+0+0")
-        else:
-            self.root.geometry("1280x720+100+100")
+        self.root.geometry(WINDOW_GEOMETRY)
         
         # Fullscreen setup
         self.root.overrideredirect(True)
@@ -82,7 +104,7 @@ class MolipeApp:
     def _create_blank_cursor(self):
         """Create a blank cursor (more reliable than cursor='none' on touchscreens)"""
         try:
-            if sys.platform.startswith("linux"):
+            if IS_LINUX:
                 # On Linux: Create a truly blank cursor using X11
                 # This is more reliable than cursor="none" for touchscreens
                 blank_cursor = "none"
@@ -115,8 +137,37 @@ class MolipeApp:
                 screen.config(cursor="none")
         except:
             pass  # Ignore errors during startup
-        # Re-check every 100ms (more aggressive)
-        self.root.after(100, self._enforce_cursor_hiding)
+        # Re-check on the shared tick
+        self.schedule("cursor", CURSOR_ENFORCE_INTERVAL_MS, self._enforce_cursor_hiding)
+    
+    def schedule(self, name, delay_ms, callback):
+        """
+        Run callback once, delay_ms from now, on the shared tick
+        Re-scheduling an existing name replaces its pending deadline
+        
+        Tk thread only: _tick reads and deletes timers without a lock, so
+        worker threads must post this call with after(0, ...)
+        """
+        self._timers[name] = (time.monotonic() + delay_ms / 1000.0, callback)
+    
+    def cancel(self, name):
+        """Cancel a pending scheduled callback (no-op if not scheduled)"""
+        self._timers.pop(name, None)
+    
+    def _tick(self):
+        """Fire every due timer, then re-arm the single Tk wakeup"""
+        now = time.monotonic()
+        for name in list(self._timers):
+            # Re-read each entry: an earlier callback may have (re)scheduled it
+            entry = self._timers.get(name)
+            if entry is None or entry[0] > now:
+                continue
+            del self._timers[name]
+            try:
+                entry[1]()
+            except Exception as e:
+                print(f"Scheduled task '{name}' failed: {e}")
+        self.root.after(TICK_INTERVAL_MS, self._tick)
     
     def _create_screens(self):
         """Create all screen instances"""
@@ -200,6 +251,7 @@ class MolipeApp:
     def cleanup(self):
         """Clean shutdown of all resources"""
         self.pd_manager.cleanup()
+        self.executor.shutdown(wait=False, cancel_futures=True)
     
     def run(self):
         """Start the application"""
@@ -4,11 +4,45 @@ Replicates exactly what Patchbox PureData module does
 """
 import subprocess
 import os
+import re
+import shutil
 import sys
+import signal
+import tempfile
 import time
 import threading
 from enum import Enum
 
+# Platform is fixed for the life of the process - decide once at import
+IS_LINUX = sys.platform.startswith("linux")
+
+# Pure Data console output goes here (never into an unread pipe)
+PD_LOG_FILE = os.path.join(tempfile.gettempdir(), "molipe-puredata.log")
+
+# Pure Data flags (Patchbox method) - binary goes before, patch path after
+# Use ALSA MIDI like Patchbox (not JACK MIDI!)
+PD_ARGS = (
+    '-stderr',              # Show errors
+    ##'-nogui',             # No GUI
+    '-alsamidi',            # Use ALSA MIDI (like Patchbox)
+    '-mididev', '1,2,3,4',  # MIDI devices 1-4 (creates 4 MIDI OUT ports)
+    '-channels', '2',       # 2 audio channels
+    '-r', '48000',          # 48kHz sample rate
+    '-outchannels', '8',    # 8 audio outputs (HiFiBerry HAT)
+    '-send', ';pd dsp 1',   # Enable audio DSP
+)
+
+# Seconds to wait for Pure Data to exit after SIGTERM before SIGKILL, and
+# after SIGKILL before giving up - bounds stop/restart latency to ~1 s
+PD_STOP_TIMEOUT = 0.5
+PD_KILL_TIMEOUT = 0.5
+
+# Fixed aconnect invocations and the client-line pattern of `aconnect -i`
+ACONNECT_DISCONNECT_ALL = ('aconnect', '-x')
+ACONNECT_LIST_INPUTS = ('aconnect', '-i')
+ACONNECT_CLIENT_RE = re.compile(r'client\s+(\d+):')
+ACONNECT_SKIP_CLIENTS = ('pure data', 'through', 'system')
+
 class PDStatus(Enum):
     """Pure Data process status"""
     STOPPED = "stopped"
@@ -22,11 +56,19 @@ class ProcessManager:
     
     def __init__(self):
         self.pd_process = None
+        self.pd_log = None
         self.current_patch = None
         self.status = PDStatus.STOPPED
         self.status_message = ""
         self.startup_thread = None
         self.midi_connector_thread = None
+        
+        # Resolve the puredata binary once (not on every launch)
+        self.pd_bin = shutil.which('puredata')
+        if self.pd_bin is None and IS_LINUX:
+            print("WARNING: puredata not found in PATH - Pure Data not installed?")
+        # Invariant part of the launch command (only the patch path varies)
+        self.pd_argv = (self.pd_bin, *PD_ARGS)
     
     def get_status(self):
         """Get current status for GUI display"""
@@ -40,7 +82,7 @@ class ProcessManager:
         try:
             print("Disconnecting all MIDI connections...")
             subprocess.run(
-                ['aconnect', '-x'],
+                ACONNECT_DISCONNECT_ALL,
                 stderr=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 timeout=2
@@ -60,19 +102,19 @@ class ProcessManager:
             
             # Get list of MIDI input ports (excluding Pure Data itself)
             result = subprocess.run(
-                ['aconnect', '-i'],
+                ACONNECT_LIST_INPUTS,
                 capture_output=True,
                 text=True,
                 timeout=2
             )
             
             # Parse port numbers (exclude Through, Pure Data, System)
-            import re
             ports = []
             for line in result.stdout.split('\n'):
                 # Look for lines like "client 20: 'USB MIDI' [type=kernel]"
-                if 'client' in line.lower() and 'pure data' not in line.lower() and 'through' not in line.lower() and 'system' not in line.lower():
-                    match = re.search(r'client\s+(\d+):', line)
+                lower = line.lower()
+                if 'client' in lower and not any(name in lower for name in ACONNECT_SKIP_CLIENTS):
+                    match = ACONNECT_CLIENT_RE.search(line)
                     if match:
                         ports.append(match.group(1))
             
@@ -89,7 +131,7 @@ class ProcessManager:
                             timeout=1
                         )
                         connections_made += 1
-                    except:
+                    except (subprocess.SubprocessError, OSError):
                         pass  # Connection failed, try next
             
             if connections_made > 0:
@@ -103,6 +145,80 @@ class ProcessManager:
             print(f"Error connecting MIDI: {e}")
             return False
     
+    def kill_all_puredata(self):
+        """
+        Send SIGTERM to every running puredata (same as `killall puredata`)
+        Scans /proc directly instead of forking killall when available
+        """
+        if not os.path.isdir('/proc'):
+            subprocess.run(['killall', 'puredata'], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+            return
+        
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/comm') as f:
+                    if f.read().strip() != 'puredata':
+                        continue
+                os.kill(int(pid), signal.SIGTERM)
+            except OSError:
+                continue  # Process exited meanwhile or not ours
+    
+    def _terminate_pd(self):
+        """
+        Stop the Pure Data we launched: SIGTERM, wait only as long as it
+        needs to exit, SIGKILL if it hangs. With no tracked process (first
+        start, or orphans from a previous run) sweep every puredata instead
+        """
+        proc = self.pd_process
+        if proc is None:
+            self.kill_all_puredata()
+            time.sleep(0.5)  # Not ours - give stray instances a moment
+            return
+        
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=PD_STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                print("Pure Data ignored SIGTERM - killing")
+                proc.kill()
+                try:
+                    proc.wait(timeout=PD_KILL_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    print("Pure Data still not reaped after SIGKILL - moving on")
+        self.pd_process = None
+    
+    def _close_log(self):
+        """Close the Pure Data log file handle (if open)"""
+        if self.pd_log:
+            try:
+                self.pd_log.close()
+            except OSError:
+                pass
+            self.pd_log = None
+    
+    def _spawn_pd(self, patch_path):
+        """Launch Pure Data on patch_path - the one place holding Popen options"""
+        cmd = [*self.pd_argv, patch_path]
+        print(f"Command: {' '.join(cmd)}")
+        
+        # Change to patch directory (like Patchbox does)
+        # Output goes to a log file: nothing reads a pipe while PD runs,
+        # so a filled pipe buffer would eventually block PD.
+        # Own session: a Ctrl-C to the GUI doesn't also kill PD.
+        self._close_log()
+        self.pd_log = open(PD_LOG_FILE, 'w')
+        return subprocess.Popen(
+            cmd,
+            cwd=os.path.dirname(patch_path),
+            stdin=subprocess.DEVNULL,
+            stdout=self.pd_log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+    
     def _startup_worker(self, patch_path):
         """Background worker for PD startup using Patchbox method"""
         try:
@@ -116,8 +232,7 @@ class ProcessManager:
             
             # Step 3: Kill Pure Data
             print("Killing existing Pure Data instances...")
-            subprocess.run(['killall', 'puredata'], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
-            time.sleep(0.5)
+            self._terminate_pd()
             
             # Step 4: Verify patch exists
             if not os.path.exists(patch_path):
@@ -126,7 +241,6 @@ class ProcessManager:
                 self.status_message = "Patch file not found"
                 return
             
-            project_dir = os.path.dirname(patch_path)
             project_patch = os.path.basename(patch_path)
             
             print(f"Loading: {project_patch}")
@@ -135,32 +249,14 @@ class ProcessManager:
             self.status = PDStatus.STARTING
             self.status_message = "Starting Pure Data..."
             
-            if sys.platform.startswith("linux"):
-                # Use ALSA MIDI like Patchbox (not JACK MIDI!)
-                cmd = [
-                    'puredata',
-                    '-stderr',           # Show errors
-                    ##'-nogui',            # No GUI
-                    '-alsamidi',         # Use ALSA MIDI (like Patchbox)
-                    '-mididev', '1,2,3,4',  # MIDI devices 1-4 (creates 4 MIDI OUT ports)
-                    '-channels', '2',    # 2 audio channels
-                    '-r', '48000',       # 48kHz sample rate
-                    '-outchannels', '8', # 8 audio outputs (HiFiBerry HAT)
-                    '-send', ';pd dsp 1',# Enable audio DSP
-                    patch_path           # Patch to load
-                ]
-                
-                print(f"Command: {' '.join(cmd)}")
+            if IS_LINUX:
+                if self.pd_bin is None:
+                    print("ERROR: puredata command not found!")
+                    self.status = PDStatus.ERROR
+                    self.status_message = "Pure Data not installed"
+                    return
                 
-                # Change to patch directory (like Patchbox does)
-                self.pd_process = subprocess.Popen(
-                    cmd,
-                    cwd=project_dir,
-                    stderr=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    text=True,
-                    bufsize=1
-                )
+                self.pd_process = self._spawn_pd(patch_path)
                 
                 # Step 6: Wait for Pure Data to initialize
                 # Patchbox uses 3 seconds
@@ -171,8 +267,11 @@ class ProcessManager:
                 # Check if still running
                 if self.pd_process.poll() is not None:
                     print("ERROR: Pure Data died immediately!")
-                    stderr_output = self.pd_process.stderr.read()
-                    print(f"Error: {stderr_output}")
+                    try:
+                        with open(PD_LOG_FILE) as f:
+                            print(f"Error: {f.read()}")
+                    except OSError:
+                        pass
                     self.status = PDStatus.ERROR
                     self.status_message = "Pure Data crashed"
                     return
@@ -243,11 +342,10 @@ class ProcessManager:
             self.disconnect_all_midi()
             
             # Kill Pure Data
-            subprocess.run(['killall', 'puredata'], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
-            time.sleep(0.5)
+            self._terminate_pd()
             
-            self.pd_process = None
             self.current_patch = None
+            self._close_log()
             
         except Exception as e:
             print(f"Error stopping PD: {e}")
@@ -6,6 +6,42 @@ import os
 import shutil
 from datetime import datetime
 
+# Free space required before copying, as a multiple of the source size
+DISK_SPACE_MARGIN = 1.5
+
+def tree_size(path, _seen=None):
+    """
+    Total size in bytes of all files below path
+    Symlinks are followed, as copytree does; each directory is counted once
+    """
+    if _seen is None:
+        _seen = set()
+    st = os.stat(path)
+    if (st.st_dev, st.st_ino) in _seen:
+        return 0  # Symlink loop or a directory linked in twice
+    _seen.add((st.st_dev, st.st_ino))
+    
+    total = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                total += tree_size(entry.path, _seen)
+            else:
+                total += entry.stat().st_size
+    return total
+
+def has_room_for(source_path, target_dir):
+    """
+    True if target_dir's filesystem can take a copy of source_path
+    Checked up front so a full SD card fails fast, not half-way through a copy
+    """
+    try:
+        needed = tree_size(source_path) * DISK_SPACE_MARGIN
+        return shutil.disk_usage(target_dir).free >= needed
+    except OSError as e:
+        print(f"Disk space check failed: {e}")
+        return True  # Can't tell - let the copy itself decide
+
 def duplicate_project(source_dir, project_name, target_dir=None):
     """
     Duplicate a project with Zettelkasten-style naming
@@ -35,6 +71,9 @@ def duplicate_project(source_dir, project_name, target_dir=None):
     new_name = generate_zettelkasten_name(project_name, target_dir)
     new_path = os.path.join(target_dir, new_name)
     
+    if not has_room_for(source_path, target_dir):
+        return False, "Not enough disk space"
+    
     # Copy project
     try:
         shutil.copytree(source_path, new_path)
@@ -4,8 +4,8 @@ Browser Screen - Page-based navigation with GitHub integration and sorting
 import tkinter as tk
 import os
 import sys
-import threading
 import json
+import threading
 from datetime import datetime
 
 # Import project duplicator and deleter
@@ -433,7 +433,7 @@ class BrowserScreen(tk.Frame):
         self.selected_project_index = None
         
         # Scan my_projects directory (inside molipe_root, same level as scripts)
-        projects_dir = os.path.join(self.app.molipe_root, "my_projects")
+        projects_dir = self.app.my_projects_dir
         
         # Set metadata file path
         self.metadata_file = os.path.join(projects_dir, ".molipe_meta")
@@ -448,8 +448,10 @@ class BrowserScreen(tk.Frame):
         
         # Scan for project folders (must have main.pd, assume patch-gui.py exists)
         try:
-            for item in sorted(os.listdir(projects_dir)):
-                item_path = os.path.join(projects_dir, item)
+            # scandir entries carry the file type, so is_dir() needs no extra stat
+            for entry in sorted(os.scandir(projects_dir), key=lambda e: e.name):
+                item = entry.name
+                item_path = entry.path
                 
                 # Skip hidden folders and files (starting with .)
                 if item.startswith('.'):
@@ -460,7 +462,7 @@ class BrowserScreen(tk.Frame):
                     continue
                 
                 # Only include directories
-                if os.path.isdir(item_path):
+                if entry.is_dir():
                     # Check if main.pd exists
                     main_pd = os.path.join(item_path, "main.pd")
                     
@@ -681,8 +683,22 @@ class BrowserScreen(tk.Frame):
             # Dynamically load GUI from project folder
             gui_path = selected_project['gui_path']
             gui_loaded = False
+            gui_exists = bool(gui_path) and os.path.exists(gui_path)
             
-            if gui_path and os.path.exists(gui_path):
+            if gui_exists:
+                # Same GUI file, unchanged since it was loaded: keep the
+                # existing screen and blank it instead of rebuilding it
+                gui_source = (gui_path, os.path.getmtime(gui_path))
+                old_screen = self.app.screens.get('patch')
+                # A screen whose listener never bound must be rebuilt
+                if (getattr(old_screen, 'gui_source', None) == gui_source
+                        and hasattr(old_screen, 'reset_display')
+                        and getattr(old_screen, 'udp_socket', None) is not None):
+                    old_screen.reset_display()
+                    gui_loaded = True
+                    print(f"Reusing patch screen for: {gui_path}")
+            
+            if gui_exists and not gui_loaded:
                 try:
                     # Import the GUI module from project folder
                     import importlib.util
@@ -722,6 +738,7 @@ class BrowserScreen(tk.Frame):
                     
                     # Create new GUI instance (assumes class is named PatchDisplayScreen)
                     new_gui = gui_module.PatchDisplayScreen(self.app.root, self.app)
+                    new_gui.gui_source = gui_source
                     self.app.screens['patch'] = new_gui
                     gui_loaded = True
                     
@@ -732,7 +749,7 @@ class BrowserScreen(tk.Frame):
                     import traceback
                     traceback.print_exc()
                     gui_loaded = False
-            else:
+            elif not gui_exists:
                 print(f"WARNING: No patch-gui.py found at: {gui_path}")
             
             # Fallback: If no GUI loaded, import default from screen_patch_display
@@ -810,7 +827,7 @@ class BrowserScreen(tk.Frame):
             self.show_sync_status("DUPLICATING...", syncing=True)
             
             # Call duplicator in background thread
-            projects_dir = os.path.join(self.app.molipe_root, "my_projects")
+            projects_dir = self.app.my_projects_dir
             
             def do_duplicate():
                 success, result = duplicate_project(projects_dir, source_name)
@@ -877,7 +894,7 @@ class BrowserScreen(tk.Frame):
             self.show_sync_status("DELETING...", syncing=True)
             
             # Call deleter in background thread
-            projects_dir = os.path.join(self.app.molipe_root, "my_projects")
+            projects_dir = self.app.my_projects_dir
             
             def do_delete():
                 success, result = delete_project(projects_dir, project_name)
@@ -5,13 +5,30 @@ import tkinter as tk
 import socket
 import subprocess
 import threading
+import time
 import os
 
+from ui_common import (
+    STATUS_READY, STATUS_OFFLINE, GITHUB_PROBE_ADDR, GITHUB_PROBE_TIMEOUT_S,
+    debounced
+)
+
 # Grid configuration (same as patch display)
 DEFAULT_ROWS = 11
 COLS_PER_ROW = [4, 4, 4, 8, 4, 4, 4, 8, 4, 8, 8]
 ROW_HEIGHTS = [60, 210, 50, 0, 0, 210, 50, 5, 20, 50, 50]
 BIG_FONT_PT = 29
+# Connectivity probe interval: reset on success, backed off on failure
+CONNECTIVITY_CHECK_INTERVAL_MS = 30000
+CONNECTIVITY_MAX_INTERVAL_MS = 300000
+CONNECTIVITY_BACKOFF_FACTOR = 1.5
+# Consecutive failed probes before an online link is shown as offline
+# (one failure is "stale" - still shown online, re-checked right away)
+OFFLINE_STRIKES_REQUIRED = 2
+# How long sudo/shutdown may take to return before it counts as failed,
+# and how long the SHUTDOWN button then shows the failure
+SHUTDOWN_WAIT_S = 5
+SHUTDOWN_FAILED_SHOW_MS = 5000
 
 class ControlScreen(tk.Frame):
     """Main control panel using grid layout"""
@@ -24,10 +41,16 @@ class ControlScreen(tk.Frame):
         self.cols_per_row = list(COLS_PER_ROW)
         
         # Internet connectivity - store at app level for other screens to access
-        self.app.has_internet = self.check_internet()
+        # (starts offline; the first background probe runs immediately)
+        self.app.has_internet = False
+        self._probe_interval_ms = CONNECTIVITY_CHECK_INTERVAL_MS
+        self._probe_in_flight = False
+        self._offline_strikes = 0
+        self._probe_skipped = False  # True while probes are paused during a PD session
         
         # UI references
         self.patch_button = None
+        self.shutdown_button = None
         self.status_label = None
         self.cell_frames = []
         
@@ -111,6 +134,7 @@ class ControlScreen(tk.Frame):
                         # SHUTDOWN button
                         btn = self._create_big_button(cell, "SHUTDOWN", self.shutdown)
                         btn.pack(fill="both", expand=True)
+                        self.shutdown_button = btn
                 
                 # Row 5 (big font row): PREFERENCES only
                 elif r == 5:
@@ -134,7 +158,7 @@ class ControlScreen(tk.Frame):
             print(f"Button clicked: {text}")
             command()
         
-        btn.bind("<Button-1>", on_click)
+        btn.bind("<Button-1>", debounced(on_click))
         print(f"Created button: {text}")
         return btn
     
@@ -173,69 +197,120 @@ class ControlScreen(tk.Frame):
         """Called when this screen becomes visible"""
         # Update PATCH button visibility
         self.refresh_button_state()
+        
+        # Probes were paused while the patch was up - refresh connectivity now
+        if self._probe_skipped:
+            self._probe_now()
     
     def update_status(self, message, error=False):
-        """Update status message"""
+        """Update status message (callers pass uppercase text)"""
         if self.status_label:
             color = "#e74c3c" if error else "#606060"
-            self.status_label.config(text=message.upper(), fg=color)
+            self.status_label.config(text=message, fg=color)
         print(f"Control Panel: {message}")
     
     def check_internet(self):
         """
         Check if GitHub is reachable (not just generic internet)
-        Used at startup to determine initial connectivity state
+        Blocks for up to the socket timeout - only call from a worker thread
         """
+        # Fresh connection each time (no caching); create_connection tries
+        # every address getaddrinfo returns, so IPv6-only networks work too
         try:
-            import socket
-            # Force a new socket connection each time (no caching)
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(("github.com", 443))
-            sock.close()
-            return result == 0
-        except Exception:
+            with socket.create_connection(GITHUB_PROBE_ADDR, timeout=GITHUB_PROBE_TIMEOUT_S):
+                return True
+        except OSError:
             return False
     
     def start_background_connectivity_monitoring(self):
         """
-        Start background thread that continuously monitors GitHub connectivity
-        Updates all screens when connectivity changes
+        Start periodic GitHub connectivity monitoring
+        The probe runs on a worker thread; results are applied on the Tk thread
         """
-        def monitor():
-            import time
-            while True:
-                time.sleep(2)  # Check every 2 seconds (faster than old 10 seconds)
-                
-                has_internet = self.check_internet()
-                
-                if has_internet != self.app.has_internet:
-                    self.app.has_internet = has_internet
-                    print(f"⚡ GitHub connectivity CHANGED: {'ONLINE' if has_internet else 'OFFLINE'}")
-                    
-                    # Update preferences screen UPDATE button AND status label
-                    if 'preferences' in self.app.screens:
-                        prefs = self.app.screens['preferences']
-                        # Update UPDATE button (grey out when offline)
-                        if hasattr(prefs, '_update_button_display'):
-                            prefs.after(0, prefs._update_button_display)
-                        # Update status label (show READY/OFFLINE MODE)
-                        if hasattr(prefs, 'update_status'):
-                            status_text = "READY" if has_internet else "OFFLINE MODE"
-                            prefs.after(0, lambda t=status_text: prefs.update_status(t))
-                    
-                    # Update browser screen buttons (if something is selected)
-                    if 'browser' in self.app.screens:
-                        browser = self.app.screens['browser']
-                        if hasattr(browser, 'selected_project_index') and browser.selected_project_index is not None:
-                            if hasattr(browser, 'update_action_buttons'):
-                                browser.after(0, browser.update_action_buttons)
-        
-        # Start background thread
-        thread = threading.Thread(target=monitor, daemon=True)
-        thread.start()
+        self._start_connectivity_probe()
         print("Background connectivity monitoring started")
     
+    def _start_connectivity_probe(self):
+        """Launch one connectivity probe off the Tk main thread"""
+        if self._probe_in_flight:
+            return
+        self._probe_in_flight = True
+        self.app.executor.submit(self._probe_internet)
+    
+    def _connectivity_tick(self):
+        """Scheduled probe - skipped while a PD session owns the screen"""
+        if self.app.current_screen == 'patch' and self.app.pd_manager.is_running():
+            # Nobody can see connectivity state now; just check again later
+            self._probe_skipped = True
+            self.app.schedule("connectivity", self._probe_interval_ms, self._connectivity_tick)
+            return
+        self._probe_skipped = False
+        self._start_connectivity_probe()
+    
+    def _probe_now(self):
+        """Force an immediate reprobe (e.g. when a screen needing connectivity is shown)"""
+        self.app.cancel("connectivity")
+        self._probe_skipped = False
+        self._start_connectivity_probe()
+    
+    def _probe_internet(self):
+        """Worker thread: probe, then hand the result back to the Tk thread"""
+        has_internet = self.check_internet()
+        try:
+            self.after(0, self._apply_connectivity_result, has_internet)
+        except RuntimeError:
+            pass  # Main loop already gone (app shutting down)
+    
+    def _apply_connectivity_result(self, has_internet):
+        """Apply a probe result (Tk thread) and schedule the next probe"""
+        self._probe_in_flight = False
+        
+        # Go online on the first success, offline only after repeated failures
+        if has_internet:
+            self._offline_strikes = 0
+        else:
+            self._offline_strikes += 1
+            if self.app.has_internet and self._offline_strikes < OFFLINE_STRIKES_REQUIRED:
+                print(f"GitHub probe failed ({self._offline_strikes}/{OFFLINE_STRIKES_REQUIRED}) - re-checking")
+                self.app.schedule("connectivity", 0, self._connectivity_tick)
+                return
+        
+        # Healthy link: probe at the base rate. Failures: back off up to the cap
+        if has_internet:
+            self._probe_interval_ms = CONNECTIVITY_CHECK_INTERVAL_MS
+        else:
+            self._probe_interval_ms = min(
+                int(self._probe_interval_ms * CONNECTIVITY_BACKOFF_FACTOR),
+                CONNECTIVITY_MAX_INTERVAL_MS
+            )
+        next_probe_ms = self._probe_interval_ms
+        
+        if has_internet != self.app.has_internet:
+            # State flipped - confirm it with a quick follow-up probe
+            next_probe_ms = 0
+            self.app.has_internet = has_internet
+            print(f"⚡ GitHub connectivity CHANGED: {'ONLINE' if has_internet else 'OFFLINE'}")
+            
+            # Update preferences screen UPDATE button AND status label
+            if 'preferences' in self.app.screens:
+                prefs = self.app.screens['preferences']
+                # Update UPDATE button (grey out when offline)
+                if hasattr(prefs, '_update_button_display'):
+                    prefs._update_button_display()
+                # Update status label (show READY/OFFLINE MODE)
+                if hasattr(prefs, 'update_status'):
+                    prefs.update_status(STATUS_READY if has_internet else STATUS_OFFLINE)
+            
+            # Update browser screen buttons (if something is selected)
+            if 'browser' in self.app.screens:
+                browser = self.app.screens['browser']
+                if hasattr(browser, 'selected_project_index') and browser.selected_project_index is not None:
+                    if hasattr(browser, 'update_action_buttons'):
+                        browser.update_action_buttons()
+        
+        # Reschedule from the Tk thread so probes never overlap
+        self.app.schedule("connectivity", next_probe_ms, self._connectivity_tick)
+    
     def shutdown(self):
         """Shutdown the system"""
         print("Shutdown button clicked!")
@@ -244,17 +319,27 @@ class ControlScreen(tk.Frame):
             self.update_status("SHUTTING DOWN...")
             
             def do_shutdown():
-                import time
                 time.sleep(1)
                 
                 # Clean up Pure Data
                 self.app.pd_manager.cleanup()
                 
                 # Shutdown system (we're on Raspberry Pi, always Linux)
+                # -n makes sudo fail rather than hang on a password prompt
+                # nobody can answer; systemd's shutdown returns 0 right away
                 try:
-                    subprocess.run(["sudo", "shutdown", "now"], check=False)
-                except Exception as e:
+                    proc = subprocess.Popen(["sudo", "-n", "shutdown", "now"], stdin=subprocess.DEVNULL)
+                    returncode = proc.wait(timeout=SHUTDOWN_WAIT_S)
+                except subprocess.TimeoutExpired:
+                    print(f"Shutdown error: no answer after {SHUTDOWN_WAIT_S}s")
+                    returncode = None
+                except OSError as e:
                     print(f"Shutdown error: {e}")
+                    returncode = None
+                
+                if returncode != 0:
+                    print(f"Shutdown failed (exit code {returncode})")
+                    self.after(0, self._show_shutdown_failed)
             
             threading.Thread(target=do_shutdown, daemon=True).start()
         
@@ -263,4 +348,17 @@ class ControlScreen(tk.Frame):
             on_yes=on_confirm_shutdown,
             return_screen='control',
             timeout=10
-        )
\ No newline at end of file
+        )
+    
+    def _show_shutdown_failed(self):
+        """Flag a failed shutdown on the SHUTDOWN button (PD is already stopped)"""
+        self.update_status("SHUTDOWN FAILED", error=True)
+        self.refresh_button_state()
+        if self.shutdown_button:
+            self.shutdown_button.config(text="FAILED", fg="#e74c3c")
+            self.app.schedule("shutdown_failed", SHUTDOWN_FAILED_SHOW_MS, self._restore_shutdown_button)
+    
+    def _restore_shutdown_button(self):
+        """Put the SHUTDOWN button back so the user can retry"""
+        if self.shutdown_button:
+            self.shutdown_button.config(text="SHUTDOWN", fg="#ffffff")
\ No newline at end of file
@@ -5,11 +5,11 @@ MENU button integrated in grid at cell (0,0) - no z-order issues
 """
 import os
 import sys
+import select
 import socket
 import threading
 import logging
 import time
-from queue import Queue, Empty
 from typing import Optional, Tuple, List, Dict, Any
 from dataclasses import dataclass
 
@@ -35,7 +35,12 @@ PROTOCOL_VERSION = "1.0"
 HOST = "0.0.0.0"
 PORT = 9001
 SOCKET_TIMEOUT_SEC = 1.0
-SOCKET_BUFFER_SIZE = 1 << 20
+SOCKET_BUFFER_SIZE = 12 << 20  # Room for bursts while Tk is busy drawing
+# Not exported by the socket module; Linux-only
+SO_RCVBUFFORCE = getattr(socket, "SO_RCVBUFFORCE", 33)
+SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40)
+RECV_BATCH_MAX = 256  # Datagrams drained per wakeup before waiting again
+RECV_BUFFER_SIZE = 16384  # Largest datagram accepted
 
 DEFAULT_ROWS = 11
 COLS_PER_ROW = [4, 4, 4, 8, 4, 4, 4, 8, 4, 8, 8]
@@ -53,6 +58,8 @@ ROW_HEIGHTS = [60, 210, 50, 0, 0, 210, 50, 5, 20, 50, 50]
 RING_START_ANGLE = 210
 RING_END_ANGLE = 330
 RING_SWEEP_MAX = 240
+# Arc extent for each 0-127 value, to a tenth of a degree
+RING_EXTENTS = tuple(round(-RING_SWEEP_MAX * v / 127.0, 1) for v in range(128))
 RING_CENTER_FONT_SIZE = 35
 RING_INNER_RADIUS = 70
 RING_OUTER_RADIUS = 103
@@ -69,8 +76,12 @@ BAR_BG_COLOR = "#000000"
 BAR_GAP_PIXELS = 2
 BAR_BORDER_WIDTH = 2
 
+REDRAW_DEBOUNCE_MS = 50  # <Configure> events this soon after a redraw are coalesced
+
 POLL_INTERVAL_MS = 33
-MAX_APPLIES_PER_TICK = 50
+SAFETY_DRAIN_MS = 100  # Drain cadence when the listener wakes Tk itself
+CELL_KEY_STRIDE = 64  # Wider than any row, so r * stride + c is unique per cell
+DRAIN_BUDGET_S = 0.006  # Wall-time spent applying updates per tick
 
 LOG_LEVEL = logging.ERROR
 logging.basicConfig(level=LOG_LEVEL)
@@ -83,6 +94,21 @@ def validate_color(color: str) -> bool:
         return len(color) in (4, 7, 9) and all(c in '0123456789abcdefABCDEF' for c in color[1:])
     return True
 
+def cell_key(r: int, c: int) -> int:
+    """Pack a cell coordinate into one int, the key pending updates use"""
+    if r < 0 or not 0 <= c < CELL_KEY_STRIDE:
+        raise ValueError(f"cell out of range: {r} {c}")
+    return r * CELL_KEY_STRIDE + c
+
+def merge_latest(dst: Dict[str, Dict[int, Any]], src: Dict[str, Dict[int, Any]]) -> None:
+    """Merge per-kind {cell_key: payload} maps; newer payloads in src win"""
+    for kind, cells in src.items():
+        existing = dst.get(kind)
+        if existing is None:
+            dst[kind] = cells
+        else:
+            existing.update(cells)
+
 _color_cache: Dict[Tuple[str, float], str] = {}
 
 def lighten_color(hex_color: str, factor: float) -> str:
@@ -120,14 +146,15 @@ def lighten_color(hex_color: str, factor: float) -> str:
 class PerformanceMetrics:
     messages_received: int = 0
     messages_processed: int = 0
+    messages_dropped: int = 0  # Kernel receive-queue overflows (Linux only)
     last_message_time: float = 0.0
     
-    def update_received(self):
-        self.messages_received += 1
+    def update_received(self, count: int = 1):
+        self.messages_received += count
         self.last_message_time = time.time()
     
-    def update_processed(self):
-        self.messages_processed += 1
+    def update_processed(self, count: int = 1):
+        self.messages_processed += count
 
 class HorizontalBar(tk.Canvas):
     def __init__(self, master, width: int = 200, height: int = 20,
@@ -149,8 +176,33 @@ class HorizontalBar(tk.Canvas):
         self._border_rect = None
         self._fill_rect = None
         
-        self.bind("<Configure>", lambda e: self._redraw())
+        self._redraw_after = None
+        self._redraw_trailing = False
+        self.bind("<Configure>", self._schedule_redraw)
+        self._redraw()
+    
+    def _schedule_redraw(self, event=None) -> None:
+        # Redraw at once on the first <Configure> (a new widget only gets its
+        # real size then); any more while the layout settles are coalesced
+        # into one redraw at the end of the window
+        if self._redraw_after is not None:
+            self._redraw_trailing = True
+            return
         self._redraw()
+        self._redraw_after = self.after(REDRAW_DEBOUNCE_MS, self._deferred_redraw)
+    
+    def _deferred_redraw(self) -> None:
+        self._redraw_after = None
+        if self._redraw_trailing and self.winfo_exists():
+            self._redraw_trailing = False
+            self._redraw()
+    
+    def destroy(self) -> None:
+        # A redraw still pending would otherwise fire on a dead widget
+        if self._redraw_after is not None:
+            self.after_cancel(self._redraw_after)
+            self._redraw_after = None
+        super().destroy()
     
     @staticmethod
     def _clip_value(v: Any) -> int:
@@ -240,25 +292,50 @@ class DualRing(tk.Frame):
         self._last_extra1_val = -1
         self._last_extra2_val = -1
         
+        # Last extent/outline written to each arc, to skip no-op itemconfigs
+        self._last_ext_outer: Optional[float] = None
+        self._last_ext_inner: Optional[float] = None
+        self._last_ext_extra1: Optional[float] = None
+        self._last_ext_extra2: Optional[float] = None
+        self._last_outline_extra1: Optional[str] = None
+        self._last_outline_extra2: Optional[str] = None
+        
         self.canvas = tk.Canvas(
             self, width=self._display_size, height=self._display_size,
             bg=bg, highlightthickness=0, bd=0
         )
         self.canvas.pack(fill="both", expand=True)
         
-        self._outer_arc_id: Optional[int] = None
-        self._inner_arc_id: Optional[int] = None
-        self._extra_arc1_id: Optional[int] = None
-        self._extra_arc2_id: Optional[int] = None
-        self._extra_dot1_id: Optional[int] = None
-        self._extra_dot2_id: Optional[int] = None
-        self._label_id: Optional[int] = None
-        self._extra_label1_id: Optional[int] = None
-        self._extra_label2_id: Optional[int] = None
-        
-        self.canvas.bind("<Configure>", lambda e: self._redraw())
+        self._create_items()
+        
+        self._redraw_after = None
+        self._redraw_trailing = False
+        self.canvas.bind("<Configure>", self._schedule_redraw)
         self._redraw()
     
+    def _schedule_redraw(self, event=None) -> None:
+        # Redraw at once on the first <Configure> (a new widget only gets its
+        # real size then); any more while the layout settles are coalesced
+        # into one redraw at the end of the window
+        if self._redraw_after is not None:
+            self._redraw_trailing = True
+            return
+        self._redraw()
+        self._redraw_after = self.after(REDRAW_DEBOUNCE_MS, self._deferred_redraw)
+    
+    def _deferred_redraw(self) -> None:
+        self._redraw_after = None
+        if self._redraw_trailing and self.winfo_exists():
+            self._redraw_trailing = False
+            self._redraw()
+    
+    def destroy(self) -> None:
+        # A redraw still pending would otherwise fire on a dead widget
+        if self._redraw_after is not None:
+            self.after_cancel(self._redraw_after)
+            self._redraw_after = None
+        super().destroy()
+    
     @staticmethod
     def _clip_value(v: Any) -> int:
         try:
@@ -334,98 +411,103 @@ class DualRing(tk.Frame):
             self._last_fg_inner = self._fg_inner
         return self._cached_light_color1, self._cached_light_color2
     
-    def _redraw(self) -> None:
-        self.canvas.delete("all")
-        
-        inner_bbox = self._bbox_for_radius(RING_INNER_RADIUS)
-        outer_bbox = self._bbox_for_radius(RING_OUTER_RADIUS)
-        extra_arc1_bbox = self._bbox_for_radius(RING_EXTRA1_RADIUS)
-        extra_arc2_bbox = self._bbox_for_radius(RING_EXTRA2_RADIUS)
-        
-        light_color1, light_color2 = self._get_light_colors()
-        
-        self.canvas.create_oval(*inner_bbox, outline="#000", width=self._w_inner)
-        self.canvas.create_oval(*outer_bbox, outline="#000", width=self._w_outer)
-        self.canvas.create_oval(*extra_arc1_bbox, outline="#000", width=RING_EXTRA_ARC_WIDTH)
-        self.canvas.create_oval(*extra_arc2_bbox, outline="#000", width=RING_EXTRA_ARC_WIDTH)
-        
-        self._inner_arc_id = self.canvas.create_arc(
-            *inner_bbox, start=RING_START_ANGLE, extent=0, style="arc",
-            outline=self._fg_inner, width=self._w_inner
+    def _create_items(self) -> None:
+        """Create every canvas item once; _redraw only moves and restyles them"""
+        canvas = self.canvas
+        self._inner_track_id = canvas.create_oval(0, 0, 1, 1, outline="#000")
+        self._outer_track_id = canvas.create_oval(0, 0, 1, 1, outline="#000")
+        self._extra1_track_id = canvas.create_oval(0, 0, 1, 1, outline="#000", width=RING_EXTRA_ARC_WIDTH)
+        self._extra2_track_id = canvas.create_oval(0, 0, 1, 1, outline="#000", width=RING_EXTRA_ARC_WIDTH)
+        
+        self._inner_arc_id = canvas.create_arc(
+            0, 0, 1, 1, start=RING_START_ANGLE, extent=0, style="arc"
         )
-        
-        self._outer_arc_id = self.canvas.create_arc(
-            *outer_bbox, start=RING_START_ANGLE, extent=0, style="arc",
-            outline=self._fg_outer, width=self._w_outer
+        self._outer_arc_id = canvas.create_arc(
+            0, 0, 1, 1, start=RING_START_ANGLE, extent=0, style="arc"
         )
-        
-        self._extra_arc1_id = self.canvas.create_arc(
-            *extra_arc1_bbox, start=RING_START_ANGLE, extent=0, style="arc",
-            outline=light_color1, width=RING_EXTRA_ARC_WIDTH
+        self._extra_arc1_id = canvas.create_arc(
+            0, 0, 1, 1, start=RING_START_ANGLE, extent=0, style="arc",
+            width=RING_EXTRA_ARC_WIDTH
         )
-        
-        self._extra_arc2_id = self.canvas.create_arc(
-            *extra_arc2_bbox, start=RING_START_ANGLE, extent=0, style="arc",
-            outline=light_color2, width=RING_EXTRA_ARC_WIDTH
+        self._extra_arc2_id = canvas.create_arc(
+            0, 0, 1, 1, start=RING_START_ANGLE, extent=0, style="arc",
+            width=RING_EXTRA_ARC_WIDTH
         )
         
-        self._extra_dot1_id = self.canvas.create_oval(
-            0, 0, RING_EXTRA_DOT_SIZE, RING_EXTRA_DOT_SIZE,
-            fill=light_color1, outline=""
+        self._extra_dot1_id = canvas.create_oval(
+            0, 0, RING_EXTRA_DOT_SIZE, RING_EXTRA_DOT_SIZE, outline=""
         )
-        self._extra_dot2_id = self.canvas.create_oval(
-            0, 0, RING_EXTRA_DOT_SIZE, RING_EXTRA_DOT_SIZE,
-            fill=light_color2, outline=""
+        self._extra_dot2_id = canvas.create_oval(
+            0, 0, RING_EXTRA_DOT_SIZE, RING_EXTRA_DOT_SIZE, outline=""
         )
         
-        cx, cy = self.canvas.winfo_width() // 2, self.canvas.winfo_height() // 2
         font = (FONT_FAMILY_PRIMARY, RING_CENTER_FONT_SIZE, "bold")
-        display_val = max(1, int(self._inner_val))
-        self._label_id = self.canvas.create_text(
-            cx, cy, text=str(display_val), fill=self._text_color, font=font
-        )
+        self._label_id = canvas.create_text(0, 0, font=font)
         
         extra_font = (FONT_FAMILY_PRIMARY, 24, "bold")
-        self._extra_label2_id = self.canvas.create_text(
-            0, 5, text="0", fill=light_color2, font=extra_font, anchor="nw"
-        )
-        self._extra_label1_id = self.canvas.create_text(
-            self.canvas.winfo_width(), 5, text="0", fill=light_color1, font=extra_font, anchor="ne"
-        )
+        self._extra_label2_id = canvas.create_text(0, 5, text="0", font=extra_font, anchor="nw")
+        self._extra_label1_id = canvas.create_text(0, 5, text="0", font=extra_font, anchor="ne")
+    
+    def _redraw(self) -> None:
+        canvas = self.canvas
+        inner_bbox = self._bbox_for_radius(RING_INNER_RADIUS)
+        outer_bbox = self._bbox_for_radius(RING_OUTER_RADIUS)
+        extra_arc1_bbox = self._bbox_for_radius(RING_EXTRA1_RADIUS)
+        extra_arc2_bbox = self._bbox_for_radius(RING_EXTRA2_RADIUS)
+        
+        try:
+            canvas.coords(self._inner_track_id, *inner_bbox)
+            canvas.itemconfig(self._inner_track_id, width=self._w_inner)
+            canvas.coords(self._outer_track_id, *outer_bbox)
+            canvas.itemconfig(self._outer_track_id, width=self._w_outer)
+            canvas.coords(self._extra1_track_id, *extra_arc1_bbox)
+            canvas.coords(self._extra2_track_id, *extra_arc2_bbox)
+            
+            canvas.coords(self._inner_arc_id, *inner_bbox)
+            canvas.itemconfig(self._inner_arc_id, outline=self._fg_inner, width=self._w_inner)
+            canvas.coords(self._outer_arc_id, *outer_bbox)
+            canvas.itemconfig(self._outer_arc_id, outline=self._fg_outer, width=self._w_outer)
+            canvas.coords(self._extra_arc1_id, *extra_arc1_bbox)
+            canvas.coords(self._extra_arc2_id, *extra_arc2_bbox)
+        except tk.TclError:
+            return
         
+        # Dots and labels are placed from the canvas size, so reposition
+        # them even though the values haven't changed
+        self._last_extra1_val = -1
+        self._last_extra2_val = -1
         self._update_extents()
+        self._update_label()
     
     def _update_extents(self) -> None:
-        ext_outer = -RING_SWEEP_MAX * (self._outer_val / 127.0)
-        ext_inner = -RING_SWEEP_MAX * (self._inner_val / 127.0)
-        ext_extra1 = -RING_SWEEP_MAX * (self._extra_arc1_val / 127.0)
-        ext_extra2 = -RING_SWEEP_MAX * (self._extra_arc2_val / 127.0)
-        
-        if self._outer_arc_id is not None:
-            try:
-                self.canvas.itemconfig(self._outer_arc_id, extent=ext_outer)
-            except tk.TclError:
-                pass
-        
-        if self._inner_arc_id is not None:
-            try:
-                self.canvas.itemconfig(self._inner_arc_id, extent=ext_inner)
-            except tk.TclError:
-                pass
+        ext_outer = RING_EXTENTS[self._outer_val]
+        ext_inner = RING_EXTENTS[self._inner_val]
+        ext_extra1 = RING_EXTENTS[self._extra_arc1_val]
+        ext_extra2 = RING_EXTENTS[self._extra_arc2_val]
         
         light_color1, light_color2 = self._get_light_colors()
+        canvas = self.canvas
         
-        if self._extra_arc1_id is not None:
-            try:
-                self.canvas.itemconfig(self._extra_arc1_id, extent=ext_extra1, outline=light_color1)
-            except tk.TclError:
-                pass
-        
-        if self._extra_arc2_id is not None:
-            try:
-                self.canvas.itemconfig(self._extra_arc2_id, extent=ext_extra2, outline=light_color2)
-            except tk.TclError:
-                pass
+        try:
+            if ext_outer != self._last_ext_outer:
+                canvas.itemconfig(self._outer_arc_id, extent=ext_outer)
+                self._last_ext_outer = ext_outer
+            
+            if ext_inner != self._last_ext_inner:
+                canvas.itemconfig(self._inner_arc_id, extent=ext_inner)
+                self._last_ext_inner = ext_inner
+            
+            if ext_extra1 != self._last_ext_extra1 or light_color1 != self._last_outline_extra1:
+                canvas.itemconfig(self._extra_arc1_id, extent=ext_extra1, outline=light_color1)
+                self._last_ext_extra1 = ext_extra1
+                self._last_outline_extra1 = light_color1
+            
+            if ext_extra2 != self._last_ext_extra2 or light_color2 != self._last_outline_extra2:
+                canvas.itemconfig(self._extra_arc2_id, extent=ext_extra2, outline=light_color2)
+                self._last_ext_extra2 = ext_extra2
+                self._last_outline_extra2 = light_color2
+        except tk.TclError:
+            pass
         
         if (self._extra_arc1_val != self._last_extra1_val or 
             self._extra_arc2_val != self._last_extra2_val):
@@ -505,7 +587,6 @@ class DualRing(tk.Frame):
             return
         
         cx, cy = self.canvas.winfo_width() // 2, self.canvas.winfo_height() // 2
-        font = (FONT_FAMILY_PRIMARY, RING_CENTER_FONT_SIZE, "bold")
         
         if self._center_override is not None:
             display_text = str(self._center_override)
@@ -513,7 +594,9 @@ class DualRing(tk.Frame):
             display_text = str(max(1, int(self._inner_val)))
         
         try:
-            self.canvas.itemconfig(self._label_id, text=display_text, fill=self._text_color, font=font)
+            # The font is fixed at creation in _create_items; passing it again
+            # would make Tk re-resolve it on every value update
+            self.canvas.itemconfig(self._label_id, text=display_text, fill=self._text_color)
             self.canvas.coords(self._label_id, cx, cy)
         except tk.TclError:
             pass
@@ -530,21 +613,37 @@ class PatchDisplayScreen(tk.Frame):
         
         self._init_fonts()
         
-        self.udp_queue = Queue()
+        # Newest payload per kind and cell_key, coalesced by the listener
+        # thread; _drain_and_apply swaps the whole dict out under the lock
+        self.udp_latest: Dict[str, Dict[int, Any]] = {}
+        self.udp_lock = threading.Lock()
         self.metrics = PerformanceMetrics()
         self.udp_thread = None
+        self.udp_socket = None
+        self.udp_stop_flag = False
+        
+        # Self-pipe the listener writes to after queueing updates, so the
+        # mainloop only wakes when there is something to draw
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._wake_pending = False
+        self._drain_interval_ms = POLL_INTERVAL_MS
+        self._drain_after_id = None
         
-        self.vars: List[List[tk.StringVar]] = []
         self.labels: List[List[tk.Label]] = []
+        self.flat_labels: List[tk.Label] = []  # Same labels, indexed by row_offsets[r] + c
         self.cell_frames: List[List[tk.Frame]] = []
         self.row_frames: List[tk.Frame] = []
         
         self._build_ui()
         
-        self.last_text: List[List[Optional[str]]] = []
-        self.last_fg: List[List[Optional[str]]] = []
-        self.last_bg: List[List[Optional[str]]] = []
-        self.last_anchor: List[List[Optional[str]]] = []
+        # Per-cell caches are flat lists indexed by row_offsets[r] + c
+        # (rows have different column counts, so r * cols doesn't work)
+        self.row_offsets: List[int] = []
+        self.last_text: List[Optional[str]] = []
+        self.last_fg: List[Optional[str]] = []
+        self.last_bg: List[Optional[str]] = []
+        self.last_anchor: List[Optional[str]] = []
         self._init_caches()
         
         self.ring_holders: List[List[Optional[tk.Frame]]] = [
@@ -561,15 +660,16 @@ class PatchDisplayScreen(tk.Frame):
             [None] * self.cols_per_row[r] for r in range(self.rows)
         ]
         
-        self.pending_latest: Dict[Tuple, Any] = {}
+        self.pending_latest: Dict[str, Dict[int, Any]] = {}
         
         # Loading state UI
         self._create_loading_ui()
         self.loading_visible = False
         self.status_polling_id = None  # Track scheduled status polling
         
+        self._start_wake_notifier()
         self._start_udp_listener()
-        self.after(POLL_INTERVAL_MS, self._drain_and_apply)
+        self._drain_after_id = self.after(self._drain_interval_ms, self._drain_and_apply)
         
         # Start status polling for PD startup (will be restarted by on_show)
         # Don't call it here - let on_show() handle it
@@ -635,10 +735,15 @@ class PatchDisplayScreen(tk.Frame):
         self.loading_message.pack()
     
     def _init_caches(self) -> None:
-        self.last_text = [[None] * self.cols_per_row[r] for r in range(self.rows)]
-        self.last_fg = [[None] * self.cols_per_row[r] for r in range(self.rows)]
-        self.last_bg = [[None] * self.cols_per_row[r] for r in range(self.rows)]
-        self.last_anchor = [[None] * self.cols_per_row[r] for r in range(self.rows)]
+        self.row_offsets = []
+        total = 0
+        for r in range(self.rows):
+            self.row_offsets.append(total)
+            total += self.cols_per_row[r]
+        self.last_text = [None] * total
+        self.last_fg = [None] * total
+        self.last_bg = [None] * total
+        self.last_anchor = [None] * total
     
     def _build_ui(self):
         """Build the patch display UI with MENU button in cell (0,0)"""
@@ -649,8 +754,8 @@ class PatchDisplayScreen(tk.Frame):
         
         self.container.columnconfigure(0, weight=1, uniform="outer_col")
         
-        self.vars.clear()
         self.labels.clear()
+        self.flat_labels.clear()
         self.cell_frames.clear()
         self.row_frames.clear()
         
@@ -673,17 +778,17 @@ class PatchDisplayScreen(tk.Frame):
                 row_frame.columnconfigure(c, weight=1, uniform=f"row{r}_col")
             row_frame.rowconfigure(0, weight=1)
             
-            row_vars, row_labels, row_cells = [], [], []
+            row_labels, row_cells = [], []
             
             for c in range(cols):
                 cell = tk.Frame(row_frame, bg="black", bd=0, highlightthickness=0)
                 cell.grid(row=0, column=c, sticky="nsew", padx=0, pady=0)
-                cell.grid_propagate(False)
+                # Cell contents are packed, so it's pack propagation that must be
+                # off: the cell size then comes from the row grid alone, and a
+                # text/font change never re-runs geometry above the cell
+                cell.pack_propagate(False)
                 row_cells.append(cell)
                 
-                var = tk.StringVar(value="")
-                row_vars.append(var)
-                
                 # SPECIAL: First cell (0,0) is MENU button
                 if r == 0 and c == 0:
                     lbl = tk.Label(
@@ -704,13 +809,10 @@ class PatchDisplayScreen(tk.Frame):
                     else:
                         fnt = self.small_font
                     
-                    if r in {2, 6}:
-                        anchor = "n"
-                    else:
-                        anchor = "w"
+                    anchor = self._default_anchor(r)
                     
                     lbl = tk.Label(
-                        cell, textvariable=var,
+                        cell, text="",
                         bg="black", fg="white",
                         anchor=anchor, padx=0, pady=0, bd=0, highlightthickness=0
                     )
@@ -719,111 +821,303 @@ class PatchDisplayScreen(tk.Frame):
                 lbl.pack(fill="both", expand=True)
                 row_labels.append(lbl)
             
-            self.vars.append(row_vars)
             self.labels.append(row_labels)
+            self.flat_labels.extend(row_labels)
             self.cell_frames.append(row_cells)
     
+    def _default_anchor(self, r: int) -> str:
+        return "n" if r in {2, 6} else "w"
+    
+    def reset_display(self):
+        """
+        Blank all cells in place so the screen looks freshly built
+        
+        Used when the same GUI file is loaded again: the widget tree, fonts
+        and UDP listener are kept instead of being destroyed and rebuilt.
+        """
+        with self.udp_lock:
+            self.udp_latest = {}
+        self.pending_latest.clear()
+        
+        for r in range(self.rows):
+            for c in range(self.cols_per_row[r]):
+                holder = self.ring_holders[r][c]
+                if holder is not None:
+                    holder.destroy()
+                    self.ring_holders[r][c] = None
+                    self.rings[r][c] = None
+                
+                holder = self.bar_holders[r][c]
+                if holder is not None:
+                    holder.destroy()
+                    self.bar_holders[r][c] = None
+                    self.bars[r][c] = None
+                
+                # MENU button keeps its text and style
+                if r == 0 and c == 0:
+                    continue
+                
+                lbl = self.labels[r][c]
+                lbl.configure(text="", fg="white", bg="black", anchor=self._default_anchor(r))
+                self.cell_frames[r][c].configure(bg="black")
+                if not lbl.winfo_manager():
+                    lbl.pack(fill="both", expand=True)
+        
+        # Grid shape is unchanged, so the caches are cleared in place
+        for cache in (self.last_text, self.last_fg, self.last_bg, self.last_anchor):
+            cache[:] = [None] * len(cache)
+        
+        # A previous connection error leaves its title on the loading overlay
+        self.loading_title.config(text="LOADING...", fg="#ffffff")
+    
+    def _start_wake_notifier(self):
+        """Register the wake pipe with Tk's file event notifier"""
+        # createfilehandler only exists on Unix builds of Tk; elsewhere the
+        # drain keeps polling at POLL_INTERVAL_MS
+        if not hasattr(self.tk, "createfilehandler"):
+            return
+        try:
+            r, w = os.pipe()
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+        except OSError:
+            return
+        try:
+            self.tk.createfilehandler(r, tk.READABLE, self._on_udp_wake)
+        except tk.TclError:
+            os.close(r)
+            os.close(w)
+            return
+        self._wake_r, self._wake_w = r, w
+        self._drain_interval_ms = SAFETY_DRAIN_MS
+    
+    def _on_udp_wake(self, fd, mask):
+        """Wake pipe readable - the listener queued new updates"""
+        try:
+            os.read(fd, 512)
+        except OSError:
+            pass
+        self._drain_and_apply()
+    
     def _start_udp_listener(self):
         """Start UDP listener thread"""
         
-        def parse_message(line: str) -> Optional[Tuple]:
-            if not line:
+        # The protocol is ASCII and whitespace-delimited, so messages are parsed
+        # as raw bytes; only strings handed to Tk (colors, align, text) are decoded.
+        # Each parser gets the arguments after the head keyword, split at most
+        # far enough that a trailing free-text field stays in one piece, and
+        # returns (kind, cell_key, payload) - pending_latest[kind][cell_key] = payload.
+        
+        def _str(b: bytes) -> str:
+            return b.decode("utf-8", errors="replace")
+        
+        def _text(tail: bytes) -> str:
+            # Free-text tail: runs of whitespace collapse to one space
+            return _str(b" ".join(tail.split()).rstrip(b";"))
+        
+        def parse_arc(rest: bytes) -> Optional[Tuple]:
+            p = rest.split()
+            if len(p) < 4:
                 return None
-            
-            if line.endswith(";"):
+            return "ARC", cell_key(int(p[1]), int(p[0])), (int(p[2]), int(p[3]))
+        
+        def parse_bar(rest: bytes) -> Optional[Tuple]:
+            p = rest.split()
+            if len(p) < 3:
+                return None
+            return "BAR", cell_key(int(p[0]), int(p[1])), int(p[2])
+        
+        def parse_align(rest: bytes) -> Optional[Tuple]:
+            p = rest.split()
+            if len(p) < 3:
+                return None
+            return "ALIGN", cell_key(int(p[0]), int(p[1])), _str(p[2])
+        
+        def parse_bg(rest: bytes) -> Optional[Tuple]:
+            p = rest.split()
+            if len(p) < 3:
+                return None
+            return "BG", cell_key(int(p[0]), int(p[1])), _str(p[2])
+        
+        def parse_ring(rest: bytes) -> Optional[Tuple]:
+            p = rest.split()
+            if len(p) < 8:
+                return None
+            return ("RING_STYLE", cell_key(int(p[1]), int(p[0])),
+                    (_str(p[2]), _str(p[3]), _str(p[4]), int(p[5]), int(p[6]), int(p[7])))
+        
+        def parse_ringval(rest: bytes) -> Optional[Tuple]:
+            p = rest.split(None, 4)
+            if len(p) < 4:
+                return None
+            text = _text(p[4]) if len(p) > 4 else None
+            return "RING_VALUE", cell_key(int(p[1]), int(p[0])), (int(p[2]), int(p[3]), text)
+        
+        def parse_ringset(rest: bytes) -> Optional[Tuple]:
+            p = rest.split()
+            if len(p) < 10:
+                return None
+            return ("RING_SET", cell_key(int(p[1]), int(p[0])),
+                    (int(p[2]), int(p[3]), _str(p[4]), _str(p[5]), _str(p[6]),
+                     int(p[7]), int(p[8]), int(p[9])))
+        
+        parsers = {
+            b"ARC": parse_arc,
+            b"BAR": parse_bar,
+            b"ALIGN": parse_align,
+            b"BG": parse_bg,
+            b"RING": parse_ring,
+            b"RINGVAL": parse_ringval,
+            b"RINGSET": parse_ringset,
+        }
+        # Senders use upper or lower case heads; list both so the common
+        # case is a single dict lookup with no per-message .upper() copy
+        parsers.update({head.lower(): fn for head, fn in list(parsers.items())})
+        
+        def parse_set(line: bytes) -> Optional[Tuple]:
+            # c r fg bg [align] text...
+            p = line.split(None, 5)
+            if len(p) < 5:
+                return None
+            c, r = int(p[0]), int(p[1])
+            if len(p) == 6:
+                fg, bg, align, text = _str(p[2]), _str(p[3]), _str(p[4]), p[5]
+            else:
+                fg, bg, align, text = _str(p[2]), _str(p[3]), None, p[4]
+            return "SET", cell_key(r, c), (_text(text), fg, bg, align)
+        
+        def parse_message(data: bytes) -> Optional[Tuple]:
+            line = data.strip()
+            if line.endswith(b";"):
                 line = line[:-1].rstrip()
             
-            parts = line.split()
-            if not parts:
+            head_rest = line.split(None, 1)
+            if not head_rest:
                 return None
             
-            head = parts[0].upper()
-            
             try:
-                if head == "ARC" and len(parts) >= 5:
-                    c, r = int(parts[1]), int(parts[2])
-                    val1, val2 = int(parts[3]), int(parts[4])
-                    return ("ARC_VALUE", r, c, val1, val2)
-                
-                if head == "BAR" and len(parts) >= 4:
-                    r, c = int(parts[1]), int(parts[2])
-                    value = int(parts[3])
-                    return ("BAR_VALUE", r, c, value)
-                
-                if head == "ALIGN" and len(parts) >= 4:
-                    r, c, align = int(parts[1]), int(parts[2]), parts[3]
-                    return ("ALIGN_CELL", r, c, align)
-                
-                if head == "BG" and len(parts) >= 4:
-                    r, c, bg = int(parts[1]), int(parts[2]), parts[3]
-                    return ("BG_CELL", r, c, bg)
-                
-                if head == "RING" and len(parts) >= 9:
-                    c, r = int(parts[1]), int(parts[2])
-                    fg_out, fg_in, bg = parts[3], parts[4], parts[5]
-                    size_px, w_out, w_in = int(parts[6]), int(parts[7]), int(parts[8])
-                    return ("RING_STYLE", r, c, fg_out, fg_in, bg, size_px, w_out, w_in)
-                
-                if head == "RINGVAL" and len(parts) >= 5:
-                    c, r = int(parts[1]), int(parts[2])
-                    outer, inner = int(parts[3]), int(parts[4])
-                    text = " ".join(parts[5:]).rstrip(";") if len(parts) > 5 else None
-                    return ("RING_VALUE", r, c, outer, inner, text)
-                
-                if head == "RINGSET" and len(parts) >= 11:
-                    c, r = int(parts[1]), int(parts[2])
-                    outer, inner = int(parts[3]), int(parts[4])
-                    fg_out, fg_in, bg = parts[5], parts[6], parts[7]
-                    size_px, w_out, w_in = int(parts[8]), int(parts[9]), int(parts[10])
-                    return ("RING_SET", r, c, outer, inner, fg_out, fg_in, bg, size_px, w_out, w_in)
-                
-                if len(parts) >= 5:
-                    c, r = int(parts[0]), int(parts[1])
-                    
-                    if len(parts) >= 6:
-                        fg, bg, align = parts[2], parts[3], parts[4]
-                        text = " ".join(parts[5:]).rstrip(";")
-                    else:
-                        fg, bg, align = parts[2], parts[3], None
-                        text = " ".join(parts[4:]).rstrip(";")
-                    
-                    return ("SET", r, c, fg, bg, align, text)
-            
+                head = head_rest[0]
+                parser = parsers.get(head)
+                if parser is None and not head[:1].isdigit():
+                    # Mixed-case head; SET lines start with a column number
+                    parser = parsers.get(head.upper())
+                if parser is not None:
+                    return parser(head_rest[1] if len(head_rest) > 1 else b"")
+                return parse_set(line)
             except (ValueError, IndexError):
                 return None
-            
-            return None
         
         def listener_loop():
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_socket = sock  # Store reference for cleanup
             
-            try:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
-            except OSError:
-                pass
+            # SO_RCVBUF is silently capped at net.core.rmem_max (~200 KB by
+            # default); SO_RCVBUFFORCE bypasses the cap where we're allowed to
+            forced = False
+            if sys.platform.startswith("linux"):
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, SOCKET_BUFFER_SIZE)
+                    forced = True
+                except OSError:
+                    pass  # Needs CAP_NET_ADMIN
+            if not forced:
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+                except OSError:
+                    pass
+            
+            # Have the kernel report its receive-queue drop counter alongside
+            # datagrams, so overflows don't go unnoticed
+            track_drops = False
+            if sys.platform.startswith("linux"):
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+                    track_drops = True
+                except OSError:
+                    pass
             
             try:
                 sock.bind((HOST, PORT))
-                sock.settimeout(SOCKET_TIMEOUT_SEC)
+                # Non-blocking: select() waits for the first datagram, then the
+                # whole burst is drained with plain recv() calls (a timeout socket
+                # would poll() before every single recv)
+                sock.setblocking(False)
             except OSError:
+                sock.close()
+                self.udp_socket = None
                 return
             
-            while True:
+            # One receive buffer for the thread's lifetime; each datagram is
+            # copied out at its real length instead of recv() allocating a
+            # full-size bytes object per packet
+            buf = bytearray(RECV_BUFFER_SIZE)
+            view = memoryview(buf)
+            bufs = [buf]
+            anc_size = socket.CMSG_SPACE(4) if track_drops else 0
+            
+            while not self.udp_stop_flag:
                 try:
-                    data, addr = sock.recvfrom(16384)
-                    self.metrics.update_received()
+                    readable, _, _ = select.select((sock,), (), (), SOCKET_TIMEOUT_SEC)
+                    if not readable:
+                        continue
                     
-                    line = data.decode("utf-8", errors="replace").strip()
-                    msg = parse_message(line)
+                    batch: Dict[str, Dict[int, Any]] = {}
+                    parsed = 0
+                    received = 0
+                    dropped = 0
+                    for _ in range(RECV_BATCH_MAX):
+                        try:
+                            if track_drops:
+                                nbytes, ancdata, _, _ = sock.recvmsg_into(bufs, anc_size)
+                                # Only attached once the socket has dropped something
+                                for level, ctype, cdata in ancdata:
+                                    if level == socket.SOL_SOCKET and ctype == SO_RXQ_OVFL:
+                                        dropped = int.from_bytes(cdata[:4], sys.byteorder)
+                            else:
+                                nbytes = sock.recv_into(buf)
+                        except BlockingIOError:
+                            break  # Kernel buffer drained
+                        received += 1
+                        
+                        msg = parse_message(view[:nbytes].tobytes())
+                        
+                        if msg:
+                            # Later messages for the same cell overwrite earlier ones
+                            kind, key, payload = msg
+                            cells = batch.get(kind)
+                            if cells is None:
+                                batch[kind] = cells = {}
+                            cells[key] = payload
+                            parsed += 1
                     
-                    if msg:
-                        self.udp_queue.put(msg)
-                        self.metrics.update_processed()
+                    # Metrics once per burst, not per datagram
+                    if received:
+                        self.metrics.update_received(received)
+                    if dropped > self.metrics.messages_dropped:
+                        print(f"WARNING: UDP receive queue overflowed, "
+                              f"{dropped} datagrams dropped so far")
+                        self.metrics.messages_dropped = dropped
+                    if batch:
+                        self.metrics.update_processed(parsed)
+                        with self.udp_lock:
+                            merge_latest(self.udp_latest, batch)
+                            wake = not self._wake_pending
+                            self._wake_pending = True
+                        wake_w = self._wake_w
+                        if wake and wake_w is not None:
+                            try:
+                                os.write(wake_w, b"\0")
+                            except OSError:
+                                pass  # Pipe full: a wakeup is already queued
                 
-                except socket.timeout:
-                    continue
                 except Exception:
                     continue
+            
+            try:
+                sock.close()
+            except OSError:
+                pass
+            self.udp_socket = None
         
         self.udp_thread = threading.Thread(target=listener_loop, daemon=True, name="UDPListener")
         self.udp_thread.start()
@@ -831,130 +1125,116 @@ class PatchDisplayScreen(tk.Frame):
     def _drain_and_apply(self):
         """Process queued UDP messages"""
         
-        while True:
-            try:
-                msg = self.udp_queue.get_nowait()
-            except Empty:
-                break
-            
-            kind = msg[0]
-            
-            if kind == "BAR_VALUE":
-                _, r, c, value = msg
-                self.pending_latest[("BAR", r, c)] = value
-            
-            elif kind == "BG_CELL":
-                _, r, c, bg = msg
-                self.pending_latest[("BG", r, c)] = bg
-            
-            elif kind == "ALIGN_CELL":
-                _, r, c, align = msg
-                self.pending_latest[("ALIGN", r, c)] = align
-            
-            elif kind == "SET":
-                _, r, c, fg, bg, align, text = msg
-                self.pending_latest[("SET", r, c)] = (text, fg, bg, align)
-            
-            elif kind == "RING_STYLE":
-                _, r, c, fg_out, fg_in, bg, size_px, w_out, w_in = msg
-                self.pending_latest[("RING_STYLE", r, c)] = (fg_out, fg_in, bg, size_px, w_out, w_in)
-            
-            elif kind == "RING_VALUE":
-                _, r, c, outer, inner, text = msg
-                self.pending_latest[("RING_VALUE", r, c)] = (outer, inner, text)
-            
-            elif kind == "RING_SET":
-                _, r, c, outer, inner, fg_out, fg_in, bg, size_px, w_out, w_in = msg
-                self.pending_latest[("RING_SET", r, c)] = (outer, inner, fg_out, fg_in, bg, size_px, w_out, w_in)
-            
-            elif kind == "ARC_VALUE":
-                _, r, c, val1, val2 = msg
-                self.pending_latest[("ARC", r, c)] = (val1, val2)
-        
-        applied = 0
-        
-        for key, bg in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "BG":
-                _, r, c = key
-                self.set_cell(r, c, None, None, bg, None)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, align in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "ALIGN":
-                _, r, c = key
-                self.set_cell(r, c, None, None, None, align)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, value in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "BAR":
-                _, r, c = key
-                self.set_bar_value(r, c, value)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, payload in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "RING_SET":
-                _, r, c = key
-                outer, inner, fg_out, fg_in, bg, size_px, w_out, w_in = payload
+        # Called both from the timer and from the wake pipe; keep one timer
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        
+        # Take everything the listener coalesced since the last tick; entries
+        # left over from an earlier capped tick are superseded by newer ones
+        with self.udp_lock:
+            fresh, self.udp_latest = self.udp_latest, {}
+            self._wake_pending = False
+        if fresh:
+            merge_latest(self.pending_latest, fresh)
+        
+        # Stop on elapsed time rather than update count: ring redraws cost far
+        # more than label changes, so a count cap is a poor frame budget
+        perf_counter = time.perf_counter
+        deadline = perf_counter() + DRAIN_BUDGET_S
+        
+        pending = self.pending_latest
+        stride = CELL_KEY_STRIDE
+        
+        cells = pending.get("BG")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                self.set_cell(r, c, None, None, cells.pop(key), None)
+        
+        cells = pending.get("ALIGN")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                self.set_cell(r, c, None, None, None, cells.pop(key))
+        
+        cells = pending.get("BAR")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                self.set_bar_value(r, c, cells.pop(key))
+        
+        cells = pending.get("RING_SET")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                outer, inner, fg_out, fg_in, bg, size_px, w_out, w_in = cells.pop(key)
                 self.set_ring_all(r, c, outer, inner, fg_out, fg_in, bg, size_px, w_out, w_in)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, payload in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "RING_STYLE":
-                _, r, c = key
-                fg_out, fg_in, bg, size_px, w_out, w_in = payload
+        
+        cells = pending.get("RING_STYLE")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                fg_out, fg_in, bg, size_px, w_out, w_in = cells.pop(key)
                 self.set_ring_style(r, c, fg_out, fg_in, bg, size_px, w_out, w_in)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, payload in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "RING_VALUE":
-                _, r, c = key
-                outer, inner, text = payload
+        
+        cells = pending.get("RING_VALUE")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                outer, inner, text = cells.pop(key)
                 self.set_ring_value(r, c, outer, inner)
                 if text is not None:
                     self.set_ring_text(r, c, text)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, payload in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "ARC":
-                _, r, c = key
-                val1, val2 = payload
+        
+        cells = pending.get("ARC")
+        if cells:
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                val1, val2 = cells.pop(key)
                 self.set_ring_extra_arcs(r, c, val1, val2)
-                del self.pending_latest[key]
-                applied += 1
-        
-        for key, payload in list(self.pending_latest.items()):
-            if applied >= MAX_APPLIES_PER_TICK:
-                break
-            if key[0] == "SET":
-                _, r, c = key
-                text, fg, bg, align = payload
+        
+        cells = pending.get("SET")
+        if cells:
+            rows, cols_per_row, row_offsets = self.rows, self.cols_per_row, self.row_offsets
+            last_text, last_fg, last_bg = self.last_text, self.last_fg, self.last_bg
+            for key in list(cells):
+                if perf_counter() >= deadline:
+                    break
+                r, c = divmod(key, stride)
+                text, fg, bg, align = cells.pop(key)
                 # Skip cell (0,0) - that's the MENU button
-                if not (r == 0 and c == 0):
-                    self.set_cell(r, c, text, fg, bg, align)
-                del self.pending_latest[key]
-                applied += 1
+                if (r == 0 and c == 0) or r >= rows or c >= cols_per_row[r]:
+                    continue
+                # Repeated sends of an unchanged cell (e.g. periodic refreshes)
+                # don't need the set_cell call at all
+                i = row_offsets[r] + c
+                if (text == last_text[i] and fg == last_fg[i] and bg == last_bg[i]
+                        and (align is None or self._map_anchor(align) == self.last_anchor[i])):
+                    continue
+                self.set_cell(r, c, text, fg, bg, align)
         
-        self.after(POLL_INTERVAL_MS, self._drain_and_apply)
+        if any(pending.values()):
+            # Out of budget with work left: continue once Tk has handled
+            # pending redraw/input events instead of waiting a full interval
+            self._drain_after_id = self.after_idle(self._drain_and_apply)
+        else:
+            # With the wake pipe this is only a safety net for lost wakeups
+            self._drain_after_id = self.after(self._drain_interval_ms, self._drain_and_apply)
     
     def _ensure_bars(self, r: int, c: int) -> None:
         if not (0 <= r < self.rows) or not (0 <= c < self.cols_per_row[r]):
@@ -966,6 +1246,9 @@ class PatchDisplayScreen(tk.Frame):
         lbl = self.labels[r][c]
         if lbl.winfo_manager():
             lbl.forget()
+            # Hidden label: the next SET must go through set_cell to unhide it
+            self.last_text[self.row_offsets[r] + c] = None
+            self.cell_frames[r][c].configure(bg=lbl.cget("bg"))
         
         holder = self.bar_holders[r][c]
         if holder is None:
@@ -1002,6 +1285,9 @@ class PatchDisplayScreen(tk.Frame):
         lbl = self.labels[r][c]
         if lbl.winfo_manager():
             lbl.forget()
+            # Hidden label: the next SET must go through set_cell to unhide it
+            self.last_text[self.row_offsets[r] + c] = None
+            self.cell_frames[r][c].configure(bg=lbl.cget("bg"))
         
         holder = self.ring_holders[r][c]
         if holder is None:
@@ -1100,6 +1386,18 @@ class PatchDisplayScreen(tk.Frame):
         if r == 0 and c == 0:
             return
         
+        # Nothing differs from what's shown: skip all widget work. A ring or
+        # bar in the cell clears last_text, so a SET that must replace one
+        # never matches here.
+        i = self.row_offsets[r] + c
+        if ((text is None or text == self.last_text[i])
+                and (not fg or fg == self.last_fg[i])
+                and (not bg or bg == self.last_bg[i])
+                and (align is None or self._map_anchor(align) == self.last_anchor[i])):
+            return
+        
+        lbl = self.flat_labels[i]
+        
         if text is not None and text != "":
             ring = self.rings[r][c]
             if ring is not None:
@@ -1117,41 +1415,51 @@ class PatchDisplayScreen(tk.Frame):
                 self.bar_holders[r][c] = None
                 self.bars[r][c] = None
             
-            lbl = self.labels[r][c]
             if not lbl.winfo_manager():
                 lbl.pack(fill="both", expand=True)
         
-        lbl = self.labels[r][c]
-        
-        if text is not None and text != self.last_text[r][c]:
-            self.vars[r][c].set(text)
-            self.last_text[r][c] = text
-        
-        if fg and fg != self.last_fg[r][c]:
-            if validate_color(fg):
-                try:
-                    lbl.configure(fg=fg)
-                    self.last_fg[r][c] = fg
-                except tk.TclError:
-                    pass
-        
-        if bg and bg != self.last_bg[r][c]:
-            if validate_color(bg):
-                try:
-                    lbl.configure(bg=bg)
-                    self.cell_frames[r][c].configure(bg=bg)
-                    self.last_bg[r][c] = bg
-                except tk.TclError:
-                    pass
-        
+        # Collect every changed option (keyed by Tcl option name) so the
+        # label gets one configure call
+        opts = {}
+        if text is not None and text != self.last_text[i]:
+            opts["-text"] = text
+        if fg and fg != self.last_fg[i] and validate_color(fg):
+            opts["-fg"] = fg
+        if bg and bg != self.last_bg[i] and validate_color(bg):
+            opts["-bg"] = bg
         if align is not None:
             anchor = self._map_anchor(align)
-            if anchor != self.last_anchor[r][c]:
+            if anchor != self.last_anchor[i]:
+                opts["-anchor"] = anchor
+        if not opts:
+            return
+        
+        # Straight to Tcl: Misc.configure would rebuild the option list
+        # through _options() on every call
+        tk_call, path = lbl.tk.call, lbl._w
+        try:
+            tk_call(path, "configure", *[v for item in opts.items() for v in item])
+        except tk.TclError:
+            # One bad value (e.g. unknown color name) fails the whole call;
+            # retry option by option so the valid ones still land
+            for opt in list(opts):
                 try:
-                    lbl.configure(anchor=anchor)
-                    self.last_anchor[r][c] = anchor
+                    tk_call(path, "configure", opt, opts[opt])
                 except tk.TclError:
-                    pass
+                    del opts[opt]
+        
+        if "-text" in opts:
+            self.last_text[i] = text
+        if "-fg" in opts:
+            self.last_fg[i] = fg
+        if "-bg" in opts:
+            # The packed label covers its frame; the frame only shows around
+            # a ring or bar (and is synced when one of those hides the label)
+            if not lbl.winfo_manager():
+                self.cell_frames[r][c].configure(bg=bg)
+            self.last_bg[i] = bg
+        if "-anchor" in opts:
+            self.last_anchor[i] = opts["-anchor"]
     
     def go_home(self):
         """MENU button pressed - return to control panel"""
@@ -1241,6 +1549,54 @@ class PatchDisplayScreen(tk.Frame):
         print("Patch display shown - starting/restarting status polling...")
         self.check_pd_status()  # This cancels existing polling and starts fresh
     
+    def cleanup(self):
+        """
+        Clean up resources before destroying this screen
+        CRITICAL: Must be called before creating a new patch screen
+        """
+        print("Cleaning up patch display...")
+        
+        # Stop status polling
+        if self.status_polling_id:
+            self.after_cancel(self.status_polling_id)
+            self.status_polling_id = None
+        
+        # Stop UDP listener thread
+        print("Stopping UDP listener...")
+        self.udp_stop_flag = True  # Signal thread to stop
+        
+        # Close socket to unblock recvfrom
+        if self.udp_socket:
+            try:
+                self.udp_socket.close()
+                print("UDP socket closed")
+            except:
+                pass
+        
+        # Wait briefly for thread to exit
+        if self.udp_thread and self.udp_thread.is_alive():
+            self.udp_thread.join(timeout=2.0)
+            if self.udp_thread.is_alive():
+                print("Warning: UDP thread did not stop cleanly")
+            else:
+                print("UDP thread stopped cleanly")
+        
+        # Stop draining and release the wake pipe
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        if self._wake_r is not None:
+            try:
+                self.tk.deletefilehandler(self._wake_r)
+            except tk.TclError:
+                pass
+            wake_r, wake_w = self._wake_r, self._wake_w
+            self._wake_r = self._wake_w = None
+            os.close(wake_r)
+            os.close(wake_w)
+        
+        print("Patch display cleanup complete")
+    
     def update_status(self, message, error=False):
         """Update status (for compatibility)"""
         print(f"Status: {message}")
\ No newline at end of file
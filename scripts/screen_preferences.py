@@ -2,15 +2,40 @@
 Preferences Screen - System settings and advanced options
 """
 import tkinter as tk
+import socket
 import subprocess
 import threading
+import time
 import sys
 import os
+import re
+from collections import deque
+
+from ui_common import (
+    STATUS_READY, STATUS_OFFLINE, GITHUB_PROBE_ADDR, GITHUB_PROBE_TIMEOUT_S,
+    debounced
+)
 
 # Grid configuration (same as other screens)
 DEFAULT_ROWS = 11
 COLS_PER_ROW = [4, 4, 4, 8, 4, 4, 4, 8, 4, 8, 8]
 ROW_HEIGHTS = [60, 210, 50, 0, 0, 210, 50, 5, 20, 50, 50]
+# An "already up to date" answer is reused for this long (like HTTP max-age);
+# pressing UPDATE again right after a cached answer forces a real check
+UPDATE_CHECK_TTL_S = 60
+
+# git fetch: overall timeout, and its progress lines shown as DOWNLOADING nn%
+FETCH_TIMEOUT_S = 60
+FETCH_PROGRESS_RE = re.compile(r'(?:Receiving objects|Resolving deltas):\s+(\d+)%')
+# Any progress line, local or remote-side ("remote: Counting objects:  40%")
+FETCH_ANY_PROGRESS_RE = re.compile(r'^(?:remote: )?\w[\w ]*:\s+\d+%')
+# Status changes within this window are coalesced into one label redraw
+STATUS_COALESCE_MS = 50
+
+# Updates touching only these paths don't need Molipe/Pure Data restarted
+# (not .txt: patches load tuning and statesave data from .txt files)
+RESTART_EXEMPT_SUFFIXES = ('.md', '.odt', '.DS_Store')
+RESTART_EXEMPT_DIRS = ('externals-src/',)  # Sources only - PD loads externals/
 
 class PreferencesScreen(tk.Frame):
     """Preferences screen with system settings"""
@@ -19,6 +44,8 @@ class PreferencesScreen(tk.Frame):
         super().__init__(parent, bg="#000000")
         self.app = app
         self.updating = False
+        self.checking_update = False  # Pre-update GitHub check in flight
+        self.last_up_to_date = None  # time.monotonic() of the last "up to date" result
         
         self.rows = DEFAULT_ROWS
         self.cols_per_row = list(COLS_PER_ROW)
@@ -26,7 +53,9 @@ class PreferencesScreen(tk.Frame):
         # UI references
         self.cell_frames = []
         self.status_label = None
-        self.update_button_cell = None  # Track UPDATE button cell for dynamic updates
+        self._pending_status = None  # (message, error) awaiting _flush_status
+        self._status_flush_id = None
+        self.update_button = None  # UPDATE button (reads OFFLINE when offline)
         
         self._build_ui()
     
@@ -82,7 +111,7 @@ class PreferencesScreen(tk.Frame):
                 # Row 0, Cell 3: Status label (upper right) - shows connectivity status
                 elif r == 0 and c == 3:
                     # Show initial connectivity status
-                    status_text = "READY" if self.app.has_internet else "OFFLINE MODE"
+                    status_text = STATUS_READY if self.app.has_internet else STATUS_OFFLINE
                     self.status_label = tk.Label(
                         cell,
                         text=status_text,
@@ -95,8 +124,11 @@ class PreferencesScreen(tk.Frame):
                 # Row 1 (big font row): Main action buttons
                 elif r == 1:
                     if c == 0:
-                        # UPDATE button - store cell reference for dynamic updates
-                        self.update_button_cell = cell
+                        # UPDATE button - one persistent label, only reconfigured
+                        # on connectivity changes. Placed (not packed): place never
+                        # propagates size to the cell, so a change can't re-layout the row
+                        self.update_button = self._create_big_button(cell, "UPDATE", self._on_update_clicked)
+                        self.update_button.place(relwidth=1, relheight=1)
                         self._update_button_display()
                     elif c == 1:
                         # EXIT TO DESKTOP button
@@ -113,29 +145,30 @@ class PreferencesScreen(tk.Frame):
             self.cell_frames.append(row_cells)
     
     def _update_button_display(self):
-        """Update the UPDATE button based on current internet connectivity"""
-        if not self.update_button_cell:
-            print("Warning: update_button_cell not initialized yet")
+        """Show UPDATE (white) if online, OFFLINE (grey) if not"""
+        if not self.update_button:
+            print("Warning: UPDATE button not initialized yet")
             return
         
         print(f"Updating UPDATE button: {'WHITE (online)' if self.app.has_internet else 'GREY (offline)'}")
         
-        # Clear the cell
-        for widget in self.update_button_cell.winfo_children():
-            widget.destroy()
-        
-        # Show UPDATE button if online, OFFLINE label if not
         if self.app.has_internet:
-            btn = self._create_big_button(self.update_button_cell, "UPDATE", self.update_molipe)
-            btn.pack(fill="both", expand=True)
+            self.update_button.config(text="UPDATE", fg="#ffffff", cursor="hand2")
         else:
-            lbl = tk.Label(
-                self.update_button_cell, text="OFFLINE",
-                font=self.app.fonts.big,
-                bg="#000000", fg="#303030",
-                bd=0, relief="flat"
-            )
-            lbl.pack(fill="both", expand=True)
+            self.update_button.config(text="OFFLINE", fg="#303030", cursor="")
+    
+    def _on_update_clicked(self):
+        """UPDATE when online; tapping OFFLINE re-checks connectivity right away"""
+        if self.app.has_internet:
+            self.update_molipe()
+        else:
+            self._recheck_connectivity()
+    
+    def _recheck_connectivity(self):
+        """Ask the control panel for an immediate connectivity probe"""
+        control = self.app.screens.get('control')
+        if control is not None and hasattr(control, '_probe_now'):
+            control._probe_now()
     
     def _create_big_button(self, parent, text, command):
         """Create a big button using BIG font (29pt)"""
@@ -150,7 +183,7 @@ class PreferencesScreen(tk.Frame):
             print(f"Button clicked: {text}")
             command()
         
-        btn.bind("<Button-1>", on_click)
+        btn.bind("<Button-1>", debounced(on_click))
         print(f"Created button: {text}")
         return btn
     
@@ -159,19 +192,63 @@ class PreferencesScreen(tk.Frame):
         self.app.show_screen('control')
     
     def update_status(self, message, error=False):
-        """Update status message"""
-        if self.status_label:
-            color = "#e74c3c" if error else "#606060"
-            self.status_label.config(text=message.upper(), fg=color)
+        """Update status message (callers pass uppercase text)"""
+        # Only the latest message of a burst reaches the label
+        self._pending_status = (message, error)
+        if self._status_flush_id is None:
+            self._status_flush_id = self.after(STATUS_COALESCE_MS, self._flush_status)
         print(f"Preferences: {message}")
     
+    def _flush_status(self):
+        """Apply the most recent pending status to the label"""
+        self._status_flush_id = None
+        pending, self._pending_status = self._pending_status, None
+        if pending and self.status_label:
+            message, error = pending
+            color = "#e74c3c" if error else "#606060"
+            self.status_label.config(text=message, fg=color)
+    
+    def _restore_status(self):
+        """Return status label to the connectivity status"""
+        self.update_status(STATUS_READY if self.app.has_internet else STATUS_OFFLINE)
+    
     def update_molipe(self):
         """Update molipe from git and restart - ULTRA-NUCLEAR OPTION"""
-        if self.updating:
+        if self.updating or self.checking_update:
+            return
+        
+        # Checked moments ago and nothing was new - answer without the network
+        if (self.last_up_to_date is not None
+                and time.monotonic() - self.last_up_to_date < UPDATE_CHECK_TTL_S):
+            print("Up to date (checked recently) - skipping GitHub")
+            self.last_up_to_date = None  # Next press does a real check
+            self.update_status("ALREADY UP TO DATE")
+            self.app.schedule("prefs_status", 3000, self._restore_status)
             return
         
-        # Final connectivity check before showing confirmation
-        if not self._check_internet():
+        # Final connectivity check before showing confirmation - the probe and
+        # the remote fix-up both block, so they run off the Tk thread
+        self.checking_update = True
+        self.app.cancel("prefs_status")
+        self.update_status("CHECKING GITHUB...")
+        
+        def precheck():
+            has_internet = self._check_internet()
+            if has_internet:
+                # Ensure Git remote uses HTTPS (not SSH) for boot reliability
+                self._ensure_https_remote()
+            try:
+                self.after(0, self._confirm_update, has_internet)
+            except RuntimeError:
+                pass  # Main loop already gone (app shutting down)
+        
+        self.app.executor.submit(precheck)
+    
+    def _confirm_update(self, has_internet):
+        """Tk thread: ask for confirmation once the pre-update check is done"""
+        self.checking_update = False
+        
+        if not has_internet:
             # Update the app-level flag
             self.app.has_internet = False
             # Update button display immediately (turn grey)
@@ -179,14 +256,10 @@ class PreferencesScreen(tk.Frame):
             # Show error message
             self.update_status("GITHUB UNREACHABLE", error=True)
             # Return to connectivity status after 3 seconds
-            def restore_status():
-                status_text = "READY" if self.app.has_internet else "OFFLINE MODE"
-                self.update_status(status_text)
-            self.after(3000, restore_status)
+            self.app.schedule("prefs_status", 3000, self._restore_status)
             return
         
-        # Ensure Git remote uses HTTPS (not SSH) for boot reliability
-        self._ensure_https_remote()
+        self._restore_status()
         
         def on_confirm_update():
             print("=== UPDATE CONFIRMED - Starting update process ===")
@@ -241,7 +314,7 @@ class PreferencesScreen(tk.Frame):
                         print("[OK] Write access OK - no permission fix needed")
                     except PermissionError:
                         print("⚠ No write access - attempting permission fix...")
-                        self.after(0, lambda: self.update_status("FIXING PERMISSIONS..."))
+                        self.after(0, self.update_status, "FIXING PERMISSIONS...")
                         
                         # Try to fix permissions (may fail if sudo requires password)
                         import pwd
@@ -268,7 +341,7 @@ class PreferencesScreen(tk.Frame):
                     
                     # Step 0b: Get current version BEFORE update
                     print("Checking current version...")
-                    self.after(0, lambda: self.update_status("CHECKING VERSION..."))
+                    self.after(0, self.update_status, "CHECKING VERSION...")
                     current_hash_result = subprocess.run(
                         ["git", "rev-parse", "HEAD"],
                         cwd=self.app.molipe_root,
@@ -352,35 +425,49 @@ class PreferencesScreen(tk.Frame):
                     
                     # Step 2: Fetch all changes (longer timeout for slow connections)
                     print("Fetching from GitHub...")
-                    self.after(0, lambda: self.update_status("DOWNLOADING..."))
+                    self.after(0, self.update_status, "DOWNLOADING...")
                     
                     # Set environment to prevent any interactive prompts
-                    fetch_env = os.environ.copy()
-                    fetch_env['GIT_TERMINAL_PROMPT'] = '0'  # Disable credential prompts
-                    fetch_env['GIT_SSH_COMMAND'] = 'ssh -o BatchMode=yes'  # Non-interactive SSH
+                    git_env = os.environ.copy()
+                    git_env['GIT_TERMINAL_PROMPT'] = '0'  # Disable credential prompts
+                    git_env['GIT_SSH_COMMAND'] = 'ssh -o BatchMode=yes'  # Non-interactive SSH
+                    git_env['GIT_OPTIONAL_LOCKS'] = '0'  # Skip optional index refresh locks
+                    git_env['LC_ALL'] = 'C'  # English messages: the "Permission denied" checks below match
                     
-                    fetch_result = subprocess.run(
-                        ["git", "fetch", "--all", "--prune"],
+                    # Cheap up-to-date check first: ls-remote only reads the ref
+                    # advertisement, so the common "nothing new" case skips the fetch
+                    ls_remote_result = subprocess.run(
+                        ["git", "ls-remote", "origin", "refs/heads/main"],
                         cwd=self.app.molipe_root,
                         capture_output=True,
                         text=True,
-                        timeout=60,  # Increased from 30s to 60s
-                        env=fetch_env  # Use non-interactive environment
+                        timeout=15,
+                        env=git_env
                     )
+                    advertised_hash = ls_remote_result.stdout.split("\t", 1)[0].strip() if ls_remote_result.returncode == 0 else ""
+                    if advertised_hash and advertised_hash == current_hash:
+                        print("Already up to date! (no fetch needed)")
+                        self.after(0, self.update_status, "ALREADY UP TO DATE")
+                        self.last_up_to_date = time.monotonic()
+                        self.updating = False
+                        self.after(0, self.app.schedule, "prefs_status", 3000, self._restore_status)
+                        return
+                    
+                    fetch_returncode, fetch_errors = self._fetch_with_progress(git_env)
                     
-                    if fetch_result.returncode != 0:
-                        error_msg = fetch_result.stderr.strip()
+                    if fetch_returncode != 0:
+                        error_msg = fetch_errors.strip()
                         print(f"Fetch error: {error_msg}")
                         
                         # Show helpful error message
                         if "Permission denied" in error_msg or "permission" in error_msg.lower():
-                            self.after(0, lambda: self.update_status("PERMISSION ERROR", error=True))
+                            self.after(0, self.update_status, "PERMISSION ERROR", True)
                             print("TIP: Try running: sudo chown -R patch:patch /home/patch/Desktop/molipe_01")
                         else:
-                            self.after(0, lambda: self.update_status("DOWNLOAD FAILED", error=True))
+                            self.after(0, self.update_status, "DOWNLOAD FAILED", True)
                         
                         self.updating = False
-                        self.after(5000, lambda: self.update_status("READY" if self.app.has_internet else "OFFLINE MODE"))
+                        self.after(0, self.app.schedule, "prefs_status", 5000, self._restore_status)
                         return
                     
                     # Step 3: Get remote version AFTER fetch
@@ -397,9 +484,10 @@ class PreferencesScreen(tk.Frame):
                     # Check if update is needed
                     if current_hash == remote_hash and current_hash != "unknown":
                         print("Already up to date!")
-                        self.after(0, lambda: self.update_status("ALREADY UP TO DATE"))
+                        self.after(0, self.update_status, "ALREADY UP TO DATE")
+                        self.last_up_to_date = time.monotonic()
                         self.updating = False
-                        self.after(3000, lambda: self.update_status("READY" if self.app.has_internet else "OFFLINE MODE"))
+                        self.after(0, self.app.schedule, "prefs_status", 3000, self._restore_status)
                         return
                     
                     print(f"Update available: {current_hash[:8]} → {remote_hash[:8]}")
@@ -409,34 +497,42 @@ class PreferencesScreen(tk.Frame):
                     subprocess.run(
                         ["git", "checkout", "-f", "main"],
                         cwd=self.app.molipe_root,
-                        capture_output=True,
-                        timeout=5
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=5,
+                        env=git_env
                     )
                     
                     # Step 5: HARD RESET to match GitHub exactly (discards ALL local changes)
                     print("Hard resetting to origin/main...")
-                    self.after(0, lambda: self.update_status("INSTALLING..."))
+                    self.after(0, self.update_status, "INSTALLING...")
                     reset_result = subprocess.run(
                         ["git", "reset", "--hard", "origin/main"],
                         cwd=self.app.molipe_root,
-                        capture_output=True,
+                        stdout=subprocess.DEVNULL,  # Only stderr is used (on failure)
+                        stderr=subprocess.PIPE,
                         text=True,
-                        timeout=10
+                        timeout=10,
+                        env=git_env
                     )
                     
                     if reset_result.returncode != 0:
                         error_msg = reset_result.stderr.strip()
                         print(f"Reset error: {error_msg}")
                         
+                        # A failed reset can leave a half-updated tree - roll back
+                        # to the version recorded in Step 0b (our git-level backup)
+                        self._restore_snapshot(current_hash, git_env)
+                        
                         # Show helpful error message
                         if "Permission denied" in error_msg or "permission" in error_msg.lower():
-                            self.after(0, lambda: self.update_status("PERMISSION ERROR", error=True))
+                            self.after(0, self.update_status, "PERMISSION ERROR", True)
                             print("TIP: Try running: sudo chown -R patch:patch /home/patch/Desktop/molipe_01")
                         else:
-                            self.after(0, lambda: self.update_status("INSTALL FAILED", error=True))
+                            self.after(0, self.update_status, "INSTALL FAILED", True)
                         
                         self.updating = False
-                        self.after(5000, lambda: self.update_status("READY" if self.app.has_internet else "OFFLINE MODE"))
+                        self.after(0, self.app.schedule, "prefs_status", 5000, self._restore_status)
                         return
                     
                     # Step 6: Clean ALL untracked and ignored files (most aggressive)
@@ -444,16 +540,23 @@ class PreferencesScreen(tk.Frame):
                     subprocess.run(
                         ["git", "clean", "-fdx"],  # -x removes ignored files too
                         cwd=self.app.molipe_root,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=10,
+                        env=git_env
                     )
                     
-                    # Step 7: Update complete - RESTART
+                    # Step 7: Update complete - RESTART (unless nothing Molipe runs changed)
                     print(f"Update complete: {current_hash[:8]} → {remote_hash[:8]}")
-                    self.after(0, lambda: self.update_status("RESTARTING..."))
+                    if not self._update_needs_restart(current_hash, remote_hash, git_env):
+                        print("Only docs/sources changed - skipping restart")
+                        self.after(0, self.update_status, "UPDATED")
+                        self.updating = False
+                        self.after(0, self.app.schedule, "prefs_status", 3000, self._restore_status)
+                        return
+                    
+                    self.after(0, self.update_status, "RESTARTING...")
                     
-                    import time
                     time.sleep(1.5)
                     
                     # Clean up Pure Data before restart
@@ -476,14 +579,14 @@ class PreferencesScreen(tk.Frame):
                         except Exception as e2:
                             print(f"Subprocess restart failed: {e2}")
                             # Give up and just show error
-                            self.after(0, lambda: self.update_status("RESTART FAILED - REBOOT SYSTEM", error=True))
+                            self.after(0, self.update_status, "RESTART FAILED - REBOOT SYSTEM", True)
                 
                 except subprocess.TimeoutExpired as e:
-                    error_msg = f"TIMEOUT: {e.cmd[0] if e.cmd else 'git'}"
+                    error_msg = f"TIMEOUT: {e.cmd[0] if e.cmd else 'git'}".upper()
                     print(f"Timeout error: {error_msg}")
-                    self.after(0, lambda msg=error_msg: self.update_status(msg, error=True))
+                    self.after(0, self.update_status, error_msg, True)
                     self.updating = False
-                    self.after(5000, lambda: self.update_status("READY" if self.app.has_internet else "OFFLINE MODE"))
+                    self.after(0, self.app.schedule, "prefs_status", 5000, self._restore_status)
                 
                 except Exception as e:
                     error_msg = str(e)  # Show full error (don't truncate)
@@ -491,10 +594,10 @@ class PreferencesScreen(tk.Frame):
                     import traceback
                     traceback.print_exc()
                     # Truncate only for display in status (but show full in console)
-                    display_msg = error_msg[:50] if len(error_msg) > 50 else error_msg
-                    self.after(0, lambda msg=display_msg: self.update_status(f"ERROR: {msg}", error=True))
+                    display_msg = (error_msg[:50] if len(error_msg) > 50 else error_msg).upper()
+                    self.after(0, self.update_status, f"ERROR: {display_msg}", True)
                     self.updating = False
-                    self.after(5000, lambda: self.update_status("READY" if self.app.has_internet else "OFFLINE MODE"))
+                    self.after(0, self.app.schedule, "prefs_status", 5000, self._restore_status)
             
             threading.Thread(target=do_update, daemon=True).start()
             print("=== UPDATE THREAD LAUNCHED ===")
@@ -514,7 +617,6 @@ class PreferencesScreen(tk.Frame):
             self.update_status("EXITING...")
             
             def do_exit():
-                import time
                 time.sleep(0.5)
                 
                 # Clean up Pure Data
@@ -546,22 +648,121 @@ class PreferencesScreen(tk.Frame):
             import traceback
             traceback.print_exc()
     
+    def _fetch_with_progress(self, git_env):
+        """
+        Worker thread: fetch origin/main, streaming git's progress to the status
+        Returns (returncode, error text); raises TimeoutExpired after FETCH_TIMEOUT_S
+        """
+        # Only main is needed; protocol v2 advertises just the refs we ask for,
+        # and gc.auto=0 keeps a background gc out of the update window
+        cmd = ["git", "-c", "protocol.version=2", "-c", "gc.auto=0",
+               "fetch", "--progress", "--prune", "origin", "main"]
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.app.molipe_root,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,  # Universal newlines: each '\r' progress redraw is a line
+            env=git_env
+        )
+        timed_out = threading.Event()
+        
+        def on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(FETCH_TIMEOUT_S, on_timeout)
+        timer.start()
+        
+        errors = deque(maxlen=20)  # Non-progress lines, kept for the error message
+        last_percent = None
+        try:
+            for line in proc.stderr:
+                match = FETCH_PROGRESS_RE.search(line)
+                if match:
+                    percent = match.group(1)
+                    if percent != last_percent:
+                        last_percent = percent
+                        self.after(0, self.update_status, f"DOWNLOADING {percent}%")
+                elif line.strip() and not FETCH_ANY_PROGRESS_RE.match(line):
+                    errors.append(line.rstrip())
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stderr.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, FETCH_TIMEOUT_S)
+        return returncode, "\n".join(errors)
+    
+    def _update_needs_restart(self, old_hash, new_hash, git_env):
+        """
+        True if the update between old_hash and new_hash touched anything
+        Molipe or Pure Data loads at runtime (restarting drops audio)
+        Errs on the side of restarting when the diff can't be read
+        """
+        if old_hash == "unknown":
+            return True
+        try:
+            result = subprocess.run(
+                ["git", "diff", "--name-only", old_hash, new_hash],
+                cwd=self.app.molipe_root,
+                capture_output=True,
+                text=True,
+                timeout=5,
+                env=git_env
+            )
+        except subprocess.TimeoutExpired:
+            return True
+        if result.returncode != 0:
+            return True
+        
+        for path in result.stdout.splitlines():
+            if path.endswith(RESTART_EXEMPT_SUFFIXES) or path.startswith(RESTART_EXEMPT_DIRS):
+                continue
+            return True
+        return False
+    
+    def _restore_snapshot(self, commit_hash, git_env):
+        """
+        Roll the working tree back to commit_hash after a failed update
+        The pre-update HEAD is the backup: no file copy is ever made
+        """
+        if commit_hash == "unknown":
+            print("No pre-update version recorded - cannot roll back")
+            return
+        
+        print(f"Rolling back to {commit_hash[:8]}...")
+        try:
+            result = subprocess.run(
+                ["git", "reset", "--hard", commit_hash],
+                cwd=self.app.molipe_root,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=10,
+                env=git_env
+            )
+            if result.returncode == 0:
+                print("[OK] Rolled back")
+            else:
+                print(f"Rollback failed: {result.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            print("Rollback timed out")
+    
     def _check_internet(self):
         """
         Check if GitHub is reachable (not just generic internet)
         Uses shorter timeout for faster detection when cable is unplugged
         """
         try:
-            import socket
             # Check GitHub specifically (not just Google DNS)
             # github.com on HTTPS port
-            # Force a new socket connection each time (no caching)
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(("github.com", 443))
-            sock.close()
-            return result == 0
-        except Exception as e:
+            # Fresh connection each time (no caching), closed on exit
+            with socket.create_connection(GITHUB_PROBE_ADDR, timeout=GITHUB_PROBE_TIMEOUT_S):
+                return True
+        except OSError as e:
             print(f"GitHub check exception: {e}")
             return False
     
@@ -624,5 +825,8 @@ class PreferencesScreen(tk.Frame):
     def on_show(self):
         """Called when this screen becomes visible"""
         # Show current connectivity status
-        status_text = "READY" if self.app.has_internet else "OFFLINE MODE"
-        self.update_status(status_text)
\ No newline at end of file
+        status_text = STATUS_READY if self.app.has_internet else STATUS_OFFLINE
+        self.update_status(status_text)
+        
+        # Connectivity matters on this screen - refresh it now
+        self._recheck_connectivity()
\ No newline at end of file
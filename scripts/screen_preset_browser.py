@@ -5,8 +5,8 @@ Matches project browser look and feel exactly
 import tkinter as tk
 import os
 import sys
-import threading
 import json
+import threading
 from datetime import datetime
 from project_duplicator import duplicate_project
 
@@ -261,10 +261,10 @@ class PresetBrowserScreen(tk.Frame):
         self.selected_preset_index = None
         
         # Scan preset_projects directory (inside molipe_root, same level as my_projects)
-        presets_dir = os.path.join(self.app.molipe_root, "preset_projects")
+        presets_dir = self.app.preset_projects_dir
         
         # Set metadata file path (points to my_projects metadata file)
-        my_projects_dir = os.path.join(self.app.molipe_root, "my_projects")
+        my_projects_dir = self.app.my_projects_dir
         self.metadata_file = os.path.join(my_projects_dir, ".molipe_meta")
         
         # Check if presets directory exists
@@ -278,15 +278,17 @@ class PresetBrowserScreen(tk.Frame):
         
         # Scan for preset folders (subfolders with main.pd)
         try:
-            for item in sorted(os.listdir(presets_dir)):
-                item_path = os.path.join(presets_dir, item)
+            # scandir entries carry the file type, so is_dir() needs no extra stat
+            for entry in sorted(os.scandir(presets_dir), key=lambda e: e.name):
+                item = entry.name
+                item_path = entry.path
                 
                 # Skip hidden folders
                 if item.startswith('.'):
                     continue
                 
                 # Only include directories
-                if os.path.isdir(item_path):
+                if entry.is_dir():
                     # Check if main.pd exists
                     main_pd = os.path.join(item_path, "main.pd")
                     
@@ -485,8 +487,8 @@ class PresetBrowserScreen(tk.Frame):
             self.update_status("STARTING...")
             
             # Duplicate preset to my_projects
-            presets_dir = os.path.join(self.app.molipe_root, "preset_projects")
-            my_projects_dir = os.path.join(self.app.molipe_root, "my_projects")
+            presets_dir = self.app.preset_projects_dir
+            my_projects_dir = self.app.my_projects_dir
             
             def do_duplicate_and_load():
                 # Use duplicate_project to copy preset to my_projects
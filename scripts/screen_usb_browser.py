@@ -7,6 +7,7 @@ import os
 import shutil
 import json
 from datetime import datetime
+from project_duplicator import has_room_for
 
 # Grid configuration (same as project browser)
 DEFAULT_ROWS = 11
@@ -14,6 +15,15 @@ COLS_PER_ROW = [4, 4, 4, 8, 4, 4, 4, 8, 4, 8, 8]
 ROW_HEIGHTS = [60, 210, 50, 0, 0, 210, 50, 5, 20, 50, 50]
 PROJECTS_PER_PAGE = 8
 
+# Files never worth importing (macOS/editor cruft, Python caches)
+IMPORT_IGNORE = shutil.ignore_patterns('.*', '__pycache__', '*.pyc', '*.swp')
+
+
+def _fast_copy(src, dst):
+    """Copy file contents and mode bits only (copy2 also copies timestamps/xattrs)"""
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
 class USBBrowserScreen(tk.Frame):
     """Browse and import projects from USB stick (exact match to project browser)"""
     
@@ -238,7 +248,7 @@ class USBBrowserScreen(tk.Frame):
     def on_show(self):
         """Called when screen becomes visible - scan USB"""
         # Set metadata file path (points to my_projects metadata file)
-        my_projects_dir = os.path.join(self.app.molipe_root, "my_projects")
+        my_projects_dir = self.app.my_projects_dir
         self.metadata_file = os.path.join(my_projects_dir, ".molipe_meta")
         
         self.scan_usb()
@@ -301,18 +311,20 @@ class USBBrowserScreen(tk.Frame):
                 print(f"Found my_projects folder: {projects_dir}")
             
             # Scan for folders with main.pd (EXACTLY like preset browser lines 281-305)
-            items = sorted(os.listdir(projects_dir))
-            print(f"Found {len(items)} items in {projects_dir}")
+            # scandir entries carry the file type, so is_dir() needs no extra stat
+            entries = sorted(os.scandir(projects_dir), key=lambda e: e.name)
+            print(f"Found {len(entries)} items in {projects_dir}")
             
-            for item in items:
-                item_path = os.path.join(projects_dir, item)
+            for entry in entries:
+                item = entry.name
+                item_path = entry.path
                 
                 # Skip hidden items
                 if item.startswith('.'):
                     continue
                 
                 # Only check directories
-                if os.path.isdir(item_path):
+                if entry.is_dir():
                     # Check if main.pd exists (EXACTLY like preset browser line 291)
                     main_pd = os.path.join(item_path, "main.pd")
                     
@@ -358,11 +370,7 @@ class USBBrowserScreen(tk.Frame):
             self.total_pages = 0
     
     def update_display(self):
-        """Update project list display (EXACT match to project browser)"""
-        # Calculate start and end indices for current page
-        start_idx = self.current_page * PROJECTS_PER_PAGE
-        end_idx = min(start_idx + PROJECTS_PER_PAGE, len(self.projects))
-        
+        """Full refresh of the page (EXACT match to project browser) - used on page change"""
         # Update page label
         if self.page_label:
             page_display = f"{self.current_page + 1}/{self.total_pages}" if self.total_pages > 0 else "0/0"
@@ -370,57 +378,7 @@ class USBBrowserScreen(tk.Frame):
         
         # Update each project label (8 projects per page)
         for i in range(PROJECTS_PER_PAGE):
-            project_idx = start_idx + i
-            
-            # Get the label tuple (name_label, meta_label)
-            name_label, meta_label = self.project_labels[i]
-            
-            # Get parent container for background styling
-            container = name_label.master
-            
-            if project_idx < end_idx:
-                # Show project
-                project = self.projects[project_idx]
-                display_name = project['name']
-                
-                # Metadata: show "from USB" indicator
-                meta_text = "from USB"
-                
-                # Determine if selected
-                is_selected = (self.selected_project_index == project_idx)
-                
-                # Update name label and container background (EXACT match to project browser)
-                if is_selected:
-                    # Selected: yellow text, dark grey background
-                    name_label.config(
-                        text=display_name,
-                        fg="#ffff00",  # Yellow (exactly like project browser)
-                        bg="#1a1a1a",  # Darker grey background
-                        font=self.app.fonts.big
-                    )
-                    # Dark grey background on container and metadata
-                    container.config(bg="#1a1a1a", highlightthickness=0)
-                    meta_label.config(bg="#1a1a1a")  # Match container background
-                else:
-                    # Unselected: white text, black background
-                    name_label.config(
-                        text=display_name,
-                        fg="#ffffff",  # White
-                        bg="black",
-                        font=self.app.fonts.big
-                    )
-                    # Black background
-                    container.config(bg="black", highlightthickness=0)
-                    meta_label.config(bg="black")
-                
-                # Update metadata text (always grey text)
-                meta_label.config(text=meta_text, fg="#606060")
-                
-            else:
-                # Empty cell
-                name_label.config(text="", fg="#606060", bg="black", font=self.app.fonts.big)
-                meta_label.config(text="", fg="#606060", bg="black")
-                container.config(bg="black", highlightthickness=0)
+            self._redraw_slot(i)
         
         # Update action button
         self.update_action_button()
@@ -428,6 +386,60 @@ class USBBrowserScreen(tk.Frame):
         # Update navigation button states
         self.update_nav_buttons()
     
+    def _redraw_slot(self, display_idx):
+        """Redraw a single project slot (display_idx is 0-7 on current page)"""
+        project_idx = self.current_page * PROJECTS_PER_PAGE + display_idx
+        
+        # Get the label tuple (name_label, meta_label)
+        name_label, meta_label = self.project_labels[display_idx]
+        
+        # Get parent container for background styling
+        container = name_label.master
+        
+        if project_idx < len(self.projects):
+            # Show project
+            project = self.projects[project_idx]
+            display_name = project['name']
+            
+            # Metadata: show "from USB" indicator
+            meta_text = "from USB"
+            
+            # Determine if selected
+            is_selected = (self.selected_project_index == project_idx)
+            
+            # Update name label and container background (EXACT match to project browser)
+            if is_selected:
+                # Selected: yellow text, dark grey background
+                name_label.config(
+                    text=display_name,
+                    fg="#ffff00",  # Yellow (exactly like project browser)
+                    bg="#1a1a1a",  # Darker grey background
+                    font=self.app.fonts.big
+                )
+                # Dark grey background on container and metadata
+                container.config(bg="#1a1a1a", highlightthickness=0)
+                meta_label.config(bg="#1a1a1a")  # Match container background
+            else:
+                # Unselected: white text, black background
+                name_label.config(
+                    text=display_name,
+                    fg="#ffffff",  # White
+                    bg="black",
+                    font=self.app.fonts.big
+                )
+                # Black background
+                container.config(bg="black", highlightthickness=0)
+                meta_label.config(bg="black")
+            
+            # Update metadata text (always grey text)
+            meta_label.config(text=meta_text, fg="#606060")
+            
+        else:
+            # Empty cell
+            name_label.config(text="", fg="#606060", bg="black", font=self.app.fonts.big)
+            meta_label.config(text="", fg="#606060", bg="black")
+            container.config(bg="black", highlightthickness=0)
+    
     def update_nav_buttons(self):
         """Update PREV/NEXT button states (matches project browser)"""
         if self.prev_button:
@@ -466,12 +478,16 @@ class USBBrowserScreen(tk.Frame):
         
         if project_idx < len(self.projects):
             # Toggle selection (exactly like project browser)
-            if self.selected_project_index == project_idx:
-                self.selected_project_index = None  # Deselect
-            else:
-                self.selected_project_index = project_idx  # Select
+            old = self.selected_project_index
+            self.selected_project_index = None if old == project_idx else project_idx
             
-            self.update_display()
+            # Only the previously and newly selected slots change - redraw just those
+            if old is not None:
+                self._redraw_slot(old - start_idx)
+            if self.selected_project_index is not None:
+                self._redraw_slot(self.selected_project_index - start_idx)
+            
+            self.update_action_button()
     
     def prev_page(self):
         """Go to previous page"""
@@ -534,8 +550,12 @@ class USBBrowserScreen(tk.Frame):
             return
         
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            # Write compact JSON to a temp file, then atomically swap it in
+            # (a power loss mid-write never leaves a truncated meta file)
+            tmp_file = self.metadata_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(metadata, f, separators=(',', ':'))
+            os.replace(tmp_file, self.metadata_file)
         except Exception as e:
             print(f"Error saving metadata: {e}")
     
@@ -549,7 +569,7 @@ class USBBrowserScreen(tk.Frame):
         """Actually perform the import (copies entire folder)"""
         try:
             # Target directory
-            target_dir = os.path.join(self.app.molipe_root, "my_projects")
+            target_dir = self.app.my_projects_dir
             target_path = os.path.join(target_dir, project_name)
             
             # Track the final name (may be renamed if conflict)
@@ -567,8 +587,19 @@ class USBBrowserScreen(tk.Frame):
             else:
                 self.update_status(f"IMPORTING '{project_name}'...")
             
-            # Copy entire project folder (all files and subdirectories)
-            shutil.copytree(source_path, target_path)
+            # Fail fast on a full SD card instead of leaving a partial copy
+            if not has_room_for(source_path, target_dir):
+                print(f"Not enough disk space to import {project_name}")
+                self.update_status("DISK FULL", error=True)
+                return
+            
+            # Copy entire project folder (all files and subdirectories),
+            # pruning hidden files and caches early in the walk
+            shutil.copytree(
+                source_path, target_path,
+                ignore=IMPORT_IGNORE,
+                copy_function=_fast_copy
+            )
             
             print(f"Import successful: {final_name}")
             
@@ -0,0 +1,29 @@
+"""
+Shared UI constants and helpers for the control and preferences screens
+"""
+import time
+
+# Taps closer together than this are touchscreen bounce, not a second press
+BUTTON_DEBOUNCE_S = 0.3
+
+# Status messages (already uppercase - update_status shows them verbatim)
+STATUS_READY = "READY"
+STATUS_OFFLINE = "OFFLINE MODE"
+
+# Connectivity probe target (GitHub HTTPS) and connect timeout in seconds.
+# A TCP handshake that hasn't completed by then means no usable link
+GITHUB_PROBE_ADDR = ("github.com", 443)
+GITHUB_PROBE_TIMEOUT_S = 0.8
+
+def debounced(handler):
+    """Wrap an event handler so a touchscreen bounce doesn't fire it twice"""
+    last_click = [0.0]
+    
+    def on_event(event):
+        now = time.monotonic()
+        if now - last_click[0] < BUTTON_DEBOUNCE_S:
+            return
+        last_click[0] = now
+        handler(event)
+    
+    return on_event